@@ -5,18 +5,22 @@ from __future__ import annotations
 import re
 
 _SNOWFLAKE_PROHIBITED = [
-    re.compile(r"::"),
-    re.compile(r"\bINTERVAL\b", re.IGNORECASE),
-    re.compile(r"\bDATE_SUB\b", re.IGNORECASE),
-    re.compile(r"\bREGEXP_MATCH\b", re.IGNORECASE),
-    re.compile(r"\bIFNULL\b", re.IGNORECASE),
+    r"::",
+    r"\bINTERVAL\b",
+    r"\bDATE_SUB\b",
+    r"\bREGEXP_MATCH\b",
+    r"\bIFNULL\b",
 ]
+# One alternation with a named group per rule so the SQL is scanned once.
+_SNOWFLAKE_SCAN = re.compile(
+    "|".join(f"(?P<p{index}>{pattern})" for index, pattern in enumerate(_SNOWFLAKE_PROHIBITED)),
+    re.IGNORECASE,
+)
 
 
 def validate_snowflake_sql(sql: str) -> list[str]:
     """Return a list of violations for non-Snowflake syntax."""
-    violations: list[str] = []
-    for pattern in _SNOWFLAKE_PROHIBITED:
-        if pattern.search(sql):
-            violations.append(f"Prohibited syntax detected: {pattern.pattern}")
-    return violations
+    hits = {int(match.lastgroup[1:]) for match in _SNOWFLAKE_SCAN.finditer(sql)}
+    return [
+        f"Prohibited syntax detected: {_SNOWFLAKE_PROHIBITED[index]}" for index in sorted(hits)
+    ]
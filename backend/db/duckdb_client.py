@@ -2,12 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TypeVar
 
 import duckdb
 
+from backend.db.pool import pool
+
+T = TypeVar("T")
+
+# Rendered SQL text for hot templated statements, keyed by (db_path, key).
+_STATEMENTS: Dict[Tuple[str, str], str] = {}
+
+# Bumped after every write that changes rows so derived caches (e.g. the
+# analytics summary table) can tell when they are stale.
+_DATA_VERSION = 0
+_DATA_VERSION_LOCK = threading.Lock()
+
+
+class _Transaction:
+    """Connection bound by an open transaction() block.
+
+    Helpers called inside the block run on the same connection and commit
+    together; ``dirty`` records whether any of them changed rows.
+    """
+
+    __slots__ = ("path", "conn", "dirty")
+
+    def __init__(self, path: str, conn: duckdb.DuckDBPyConnection) -> None:
+        self.path = path
+        self.conn = conn
+        self.dirty = False
+
+
+_ACTIVE_TRANSACTION: ContextVar[_Transaction | None] = ContextVar(
+    "duckdb_active_transaction", default=None
+)
+
+# DuckDB calls are blocking C calls; async handlers offload them here so the
+# event loop keeps serving other requests while a query runs.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DUCKDB_EXECUTOR_THREADS", "0")) or (os.cpu_count() or 1) * 2,
+    thread_name_prefix="duckdb",
+)
+
 
 def _resolve_path(db_path: str | None = None) -> str:
     """Resolve the DuckDB path from overrides or environment.
@@ -32,7 +76,7 @@ def get_db_path() -> str:
 
 @contextmanager
 def get_connection(db_path: str | None = None) -> Iterator[duckdb.DuckDBPyConnection]:
-    """Yield a DuckDB connection and ensure it closes.
+    """Yield a pooled DuckDB connection and return it to the pool afterwards.
 
     Args:
         db_path: Optional explicit database path.
@@ -41,11 +85,85 @@ def get_connection(db_path: str | None = None) -> Iterator[duckdb.DuckDBPyConnec
         DuckDBPyConnection: Active connection instance.
     """
     path = _resolve_path(db_path)
-    conn = duckdb.connect(path)
-    try:
+    active = _ACTIVE_TRANSACTION.get()
+    if active is not None and active.path == path:
+        yield active.conn
+        return
+    with pool.acquire(path) as conn:
         yield conn
-    finally:
-        conn.close()
+
+
+def close_pools() -> None:
+    """Close idle pooled connections, e.g. on application shutdown."""
+    pool.close()
+
+
+@contextmanager
+def transaction(db_path: str | None = None) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Run the enclosed statements in one DuckDB transaction.
+
+    ``query_rows``/``execute`` calls made inside the block reuse the
+    transaction's connection. Nested blocks join the outer transaction.
+
+    Args:
+        db_path: Optional explicit database path.
+
+    Yields:
+        DuckDBPyConnection: Connection holding the open transaction.
+    """
+    path = _resolve_path(db_path)
+    active = _ACTIVE_TRANSACTION.get()
+    if active is not None and active.path == path:
+        yield active.conn
+        return
+    with get_connection(path) as conn:
+        conn.execute("BEGIN TRANSACTION")
+        state = _Transaction(path, conn)
+        token = _ACTIVE_TRANSACTION.set(state)
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+            if state.dirty:
+                _bump_data_version()
+        finally:
+            _ACTIVE_TRANSACTION.reset(token)
+
+
+def data_version() -> int:
+    """Return a counter that increases whenever a write changes rows.
+
+    Returns:
+        Current write version for this process.
+    """
+    return _DATA_VERSION
+
+
+def _bump_data_version() -> None:
+    global _DATA_VERSION
+    with _DATA_VERSION_LOCK:
+        _DATA_VERSION += 1
+
+
+def _record_write(changed: bool, db_path: str | None) -> None:
+    # Writes inside a transaction() block count once, on commit.
+    if not changed:
+        return
+    active = _ACTIVE_TRANSACTION.get()
+    if active is not None and active.path == _resolve_path(db_path):
+        active.dirty = True
+    else:
+        _bump_data_version()
+
+
+def _rows_changed(result: duckdb.DuckDBPyConnection) -> bool:
+    # DML reports its row count as a single "Count" row; DDL returns no row
+    # and is treated as a change.
+    row = result.fetchone()
+    return row is None or bool(row[0])
 
 
 def ensure_tables(db_path: str | None = None) -> None:
@@ -58,7 +176,7 @@ def ensure_tables(db_path: str | None = None) -> None:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS rg_analyst_notes_log (
-                log_id VARCHAR,
+                log_id VARCHAR DEFAULT uuid(),
                 player_id VARCHAR,
                 analyst_id VARCHAR,
                 analyst_action VARCHAR,
@@ -67,6 +185,7 @@ def ensure_tables(db_path: str | None = None) -> None:
             )
             """
         )
+        _ensure_default(conn, "rg_analyst_notes_log", "log_id", "uuid()")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS rg_llm_prompt_log (
@@ -182,6 +301,64 @@ def ensure_tables(db_path: str | None = None) -> None:
             )
             """
         )
+        # One draft per player. Older databases may hold duplicates from the
+        # old delete-then-insert save, so keep the latest before indexing.
+        # (DuckDB 0.10 ignores IF NOT EXISTS for unique indexes, hence the check.)
+        if not conn.execute(
+            "SELECT 1 FROM duckdb_indexes() WHERE index_name = ?",
+            ("idx_rg_analyst_notes_draft_player",),
+        ).fetchall():
+            conn.execute(
+                """
+                DELETE FROM rg_analyst_notes_draft
+                WHERE rowid NOT IN (
+                    SELECT ARG_MAX(rowid, updated_at)
+                    FROM rg_analyst_notes_draft
+                    GROUP BY player_id
+                )
+                """
+            )
+            conn.execute(
+                "CREATE UNIQUE INDEX idx_rg_analyst_notes_draft_player "
+                "ON rg_analyst_notes_draft (player_id)"
+            )
+        # DuckDB only uses single-column ART indexes for point lookups, so
+        # index player_id on the tables read per case.
+        for table in (
+            "rg_queue_cases",
+            "rg_case_status_log",
+            "rg_analyst_notes_log",
+            "rg_nudge_log",
+        ):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_player ON {table} (player_id)"
+            )
+
+
+def _ensure_default(
+    conn: duckdb.DuckDBPyConnection, table: str, column: str, default: str
+) -> None:
+    """Add a column default to a table created before the default existed.
+
+    DuckDB refuses ALTER on tables that have indexes, so only alter when the
+    default is actually missing.
+
+    Args:
+        conn: Open DuckDB connection.
+        table: Table name.
+        column: Column name.
+        default: SQL default expression.
+    """
+    rows = conn.execute(
+        """
+        SELECT column_default
+        FROM duckdb_columns()
+        WHERE table_name = ? AND column_name = ?
+        """,
+        (table, column),
+    ).fetchall()
+    if rows and rows[0][0] is None:
+        conn.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
 
 
 def query_rows(
@@ -206,6 +383,87 @@ def query_rows(
         return [dict(zip(columns, row)) for row in result.fetchall()]
 
 
+def query_rows_cached(
+    key: str,
+    sql_factory: Callable[[], str],
+    params: Iterable[Any] | None = None,
+    db_path: str | None = None,
+) -> List[Dict[str, Any]]:
+    """Run a templated query whose SQL text is rendered once per database.
+
+    The DuckDB Python client cannot reuse prepared statements across calls,
+    so this keeps the SQL text stable and skips re-rendering the template
+    (and any schema lookups inside ``sql_factory``) on every request.
+
+    Args:
+        key: Stable name for the statement.
+        sql_factory: Callable returning the fully rendered SQL.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        List of result rows as dictionaries.
+    """
+    return query_rows(_statement(key, sql_factory, db_path), params, db_path=db_path)
+
+
+def query_columns(
+    sql: str, params: Iterable[Any] | None = None, db_path: str | None = None
+) -> Dict[str, List[Any]]:
+    """Run a query and return its result column by column.
+
+    Converting whole columns at once avoids building a dict per row, which
+    adds up on wide list endpoints.
+
+    Args:
+        sql: SQL query to execute.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        Mapping of column name to its values (NULLs as ``None``).
+    """
+    with get_connection(db_path) as conn:
+        if params:
+            result = conn.execute(sql, params)
+        else:
+            result = conn.execute(sql)
+        return {name: values.tolist() for name, values in result.fetchnumpy().items()}
+
+
+def query_columns_cached(
+    key: str,
+    sql_factory: Callable[[], str],
+    params: Iterable[Any] | None = None,
+    db_path: str | None = None,
+) -> Dict[str, List[Any]]:
+    """Column-wise variant of :func:`query_rows_cached`.
+
+    Args:
+        key: Stable name for the statement.
+        sql_factory: Callable returning the fully rendered SQL.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        Mapping of column name to its values (NULLs as ``None``).
+    """
+    return query_columns(_statement(key, sql_factory, db_path), params, db_path=db_path)
+
+
+def _statement(key: str, sql_factory: Callable[[], str], db_path: str | None) -> str:
+    cache_key = (_resolve_path(db_path), key)
+    sql = _STATEMENTS.get(cache_key)
+    if sql is None:
+        sql = _STATEMENTS.setdefault(cache_key, sql_factory())
+    return sql
+
+
+def clear_statement_cache() -> None:
+    """Drop rendered statements so they are rebuilt on next use."""
+    _STATEMENTS.clear()
+
+
 def execute(
     sql: str, params: Tuple[Any, ...] | None = None, db_path: str | None = None
 ) -> None:
@@ -217,7 +475,103 @@ def execute(
         db_path: Optional explicit database path.
     """
     with get_connection(db_path) as conn:
-        if params:
-            conn.execute(sql, params)
-        else:
-            conn.execute(sql)
+        result = conn.execute(sql, params) if params else conn.execute(sql)
+        changed = _rows_changed(result)
+    _record_write(changed, db_path)
+
+
+def execute_returning(
+    sql: str, params: Tuple[Any, ...] | None = None, db_path: str | None = None
+) -> List[Dict[str, Any]]:
+    """Execute a write with a ``RETURNING`` clause and return its rows.
+
+    Args:
+        sql: SQL statement to execute.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        Returned rows as dictionaries.
+    """
+    rows = query_rows(sql, params, db_path=db_path)
+    _record_write(bool(rows), db_path)
+    return rows
+
+
+def execute_many(
+    sql: str, params_seq: Iterable[Tuple[Any, ...]], db_path: str | None = None
+) -> None:
+    """Execute a statement once per parameter tuple in a single call.
+
+    Args:
+        sql: SQL statement to execute.
+        params_seq: Sequence of positional parameter tuples.
+        db_path: Optional explicit database path.
+    """
+    params_list = list(params_seq)
+    if not params_list:
+        return
+    with get_connection(db_path) as conn:
+        conn.executemany(sql, params_list)
+    # executemany leaves no row count behind; a non-empty batch counts as a change.
+    _record_write(True, db_path)
+
+
+async def arun(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking DuckDB helper on the shared executor.
+
+    Args:
+        func: Synchronous callable that performs DuckDB work.
+        *args: Positional arguments forwarded to ``func``.
+        **kwargs: Keyword arguments forwarded to ``func``.
+
+    Returns:
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+async def aquery_rows(
+    sql: str, params: Iterable[Any] | None = None, db_path: str | None = None
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`query_rows` that does not block the event loop.
+
+    Args:
+        sql: SQL query to execute.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        List of result rows as dictionaries.
+    """
+    return await arun(query_rows, sql, params, db_path=db_path)
+
+
+async def aexecute(
+    sql: str, params: Tuple[Any, ...] | None = None, db_path: str | None = None
+) -> None:
+    """Async variant of :func:`execute` that does not block the event loop.
+
+    Args:
+        sql: SQL statement to execute.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+    """
+    await arun(execute, sql, params, db_path=db_path)
+
+
+async def aexecute_returning(
+    sql: str, params: Tuple[Any, ...] | None = None, db_path: str | None = None
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`execute_returning` that does not block the event loop.
+
+    Args:
+        sql: SQL statement to execute.
+        params: Optional positional parameters.
+        db_path: Optional explicit database path.
+
+    Returns:
+        Returned rows as dictionaries.
+    """
+    return await arun(execute_returning, sql, params, db_path=db_path)
@@ -0,0 +1,142 @@
+"""Process-local DuckDB connection pool keyed by database path."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+import duckdb
+
+
+class ConnectionPool:
+    """Bounded pool of long-lived DuckDB connections per database path.
+
+    DuckDB runs one query at a time per connection but parallelises across
+    connections, so handlers check a connection out for the duration of a
+    call and put it back afterwards. The most recently returned connection
+    is handed out first to keep a warm working set.
+
+    An open connection holds the DuckDB file lock, so once every connection
+    for a path has been idle for ``idle_timeout`` seconds they are closed and
+    other processes (seed scripts, dbt, the DuckDB CLI) can open the file.
+    """
+
+    def __init__(self, size: int, idle_timeout: float = 0.0) -> None:
+        """Create an empty pool.
+
+        Args:
+            size: Maximum connections per path; ``<= 0`` opens a fresh
+                connection per call instead of pooling.
+            idle_timeout: Seconds a fully idle path keeps its connections
+                open; ``<= 0`` keeps them until :meth:`close`.
+        """
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[str, "queue.LifoQueue[duckdb.DuckDBPyConnection]"] = {}
+        self._counts: Dict[str, int] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, path: str) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a connection for ``path`` and return it afterwards.
+
+        Args:
+            path: Resolved DuckDB path.
+
+        Yields:
+            DuckDBPyConnection: Connection reserved for the caller.
+        """
+        if self.size <= 0:
+            conn = duckdb.connect(path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+        conn = self._checkout(path)
+        try:
+            yield conn
+        except BaseException:
+            # Never hand the next caller a connection stuck mid-transaction.
+            try:
+                conn.execute("ROLLBACK")
+            except duckdb.Error:
+                pass
+            raise
+        finally:
+            self._release(path, conn)
+
+    def _checkout(self, path: str) -> duckdb.DuckDBPyConnection:
+        with self._lock:
+            idle = self._idle.setdefault(path, queue.LifoQueue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                pass
+            create = self._counts.get(path, 0) < self.size
+            if create:
+                self._counts[path] = self._counts.get(path, 0) + 1
+        if not create:
+            return idle.get()
+        try:
+            return duckdb.connect(path)
+        except Exception:
+            with self._lock:
+                self._counts[path] -= 1
+            raise
+
+    def _release(self, path: str, conn: duckdb.DuckDBPyConnection) -> None:
+        idle = self._idle[path]
+        idle.put(conn)
+        if self.idle_timeout <= 0:
+            return
+        with self._lock:
+            if idle.qsize() < self._counts.get(path, 0):
+                return  # Still in use; the last connection back arms the timer.
+            timer = self._timers.get(path)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.idle_timeout, self._close_if_idle, args=(path,))
+            timer.daemon = True
+            self._timers[path] = timer
+            timer.start()
+
+    def _close_if_idle(self, path: str) -> None:
+        with self._lock:
+            if self._timers.get(path) is not threading.current_thread():
+                return  # Superseded by a later release.
+            del self._timers[path]
+            if self._idle[path].qsize() < self._counts.get(path, 0):
+                return
+            self._drain(path)
+
+    def _drain(self, path: str) -> None:
+        # Caller holds self._lock.
+        idle = self._idle[path]
+        while True:
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            self._counts[path] -= 1
+
+    def close(self) -> None:
+        """Close idle connections, e.g. on application shutdown."""
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            for path in self._idle:
+                self._drain(path)
+
+
+# Shared pool used by duckdb_client; DUCKDB_POOL_SIZE=0 disables pooling.
+pool = ConnectionPool(
+    int(os.getenv("DUCKDB_POOL_SIZE", "4")),
+    idle_timeout=float(os.getenv("DUCKDB_POOL_IDLE_SECONDS", "1")),
+)
@@ -10,19 +10,27 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from dotenv import load_dotenv
 
 from ai_services.config import LLMConfig
 from ai_services.llm_safety_validator import LLMSafetyValidator
 from ai_services.openai_provider import OpenAIProvider
 from ai_services.semantic_auditor import BehavioralSemanticAuditor
-from backend.db.duckdb_client import ensure_tables
+from backend.db.duckdb_client import close_pools, ensure_tables, get_db_path
 from backend.routers import ai as ai_router
 from backend.routers import cases as cases_router
 from backend.routers import data as data_router
 from backend.routers import interventions as interventions_router
 from backend.routers import sql as sql_router
 
+try:
+    import orjson  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    DefaultResponse = JSONResponse
+else:
+    DefaultResponse = ORJSONResponse
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -63,6 +71,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     logger.info("Starting DK Sentinel API")
     ensure_tables()
+    sql_router.warm_column_catalog(get_db_path())
 
     config = LLMConfig()
     provider = _build_provider(config)
@@ -79,6 +88,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Startup complete")
     yield
     logger.info("Shutting down DK Sentinel API")
+    close_pools()
 
 
 app = FastAPI(
@@ -86,6 +96,7 @@ app = FastAPI(
     description="Responsible Gaming Analytics Intelligence System",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 app.add_middleware(
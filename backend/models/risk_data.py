@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from backend.models.hitl import AnalystNoteResponse, PromptLogEntry
+from backend.models.queries import CaseTimelineEntry, QueryLogEntry, TriggerCheckResult
+
 
 class RiskCase(BaseModel):
     """Queue case payload."""
@@ -53,8 +56,8 @@ class CaseFileResponse(BaseModel):
     """Aggregated case file response."""
 
     case_detail: CaseDetail
-    latest_note: dict | None
-    prompt_logs: list[dict]
-    query_logs: list[dict]
-    timeline: list[dict]
-    trigger_checks: list[dict] = []
+    latest_note: AnalystNoteResponse | None
+    prompt_logs: list[PromptLogEntry]
+    query_logs: list[QueryLogEntry]
+    timeline: list[CaseTimelineEntry]
+    trigger_checks: list[TriggerCheckResult] = []
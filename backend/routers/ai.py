@@ -23,6 +23,7 @@ from backend.models.hitl import PromptLogEntry
 from backend.models.prompt_router import PromptRouteRequest, PromptRouteResponse
 from backend.models.queries import QueryDraftRequest, QueryDraftResponse
 from backend.utils.pii import redact_text
+from backend.utils.stamps import iso_sql
 
 router = APIRouter()
 _PROHIBITED_SQL_PATTERN = re.compile(
@@ -318,8 +319,9 @@ async def get_prompt_logs(
         List of prompt log entries.
     """
     rows = query_rows(
-        """
-        SELECT player_id, analyst_id, prompt_text, response_text, created_at, route_type, tool_used
+        f"""
+        SELECT player_id, analyst_id, prompt_text, response_text,
+               {iso_sql('created_at')} AS created_at, route_type, tool_used
         FROM rg_llm_prompt_log
         WHERE player_id = ?
         ORDER BY created_at DESC
@@ -336,7 +338,7 @@ async def get_prompt_logs(
             response_text=row["response_text"],
             route_type=row.get("route_type"),
             tool_used=row.get("tool_used"),
-            created_at=str(row["created_at"]),
+            created_at=row["created_at"],
         )
         for row in rows
     ]
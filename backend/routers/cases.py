@@ -4,11 +4,18 @@ from __future__ import annotations
 
 from datetime import datetime
 from uuid import uuid4
-import json
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from backend.db.duckdb_client import execute, get_db_path, query_rows
+from backend.db.duckdb_client import (
+    aexecute,
+    aquery_rows,
+    arun,
+    execute,
+    get_db_path,
+    query_rows,
+    transaction,
+)
 from backend.models.case_status import CaseStatusEntry, CaseStatusRequest
 from backend.models.queries import (
     CaseTimelineEntry,
@@ -16,7 +23,9 @@ from backend.models.queries import (
     QueryLogRequest,
     TriggerCheckResult,
 )
+from backend.utils import fastjson
 from backend.utils.pii import find_pii_column, redact_text
+from backend.utils.stamps import iso_sql
 from backend.utils.supabase_client import insert_audit
 
 router = APIRouter()
@@ -45,7 +54,7 @@ async def create_query_log(
     log_id = str(uuid4())
     safe_prompt = redact_text(payload.prompt_text)
 
-    execute(
+    await aexecute(
         """
         INSERT INTO rg_query_log (
             log_id,
@@ -72,8 +81,8 @@ async def create_query_log(
             payload.final_sql,
             payload.purpose,
             payload.result_summary,
-            json.dumps(payload.result_columns) if payload.result_columns else None,
-            json.dumps(payload.result_rows) if payload.result_rows else None,
+            fastjson.dumps(payload.result_columns) if payload.result_columns else None,
+            fastjson.dumps(payload.result_rows) if payload.result_rows else None,
             payload.row_count,
             payload.duration_ms,
             created_at,
@@ -102,10 +111,11 @@ async def get_query_logs(
     player_id: str, db_path: str = Depends(get_db_path)
 ) -> list[QueryLogEntry]:
     """Return query log entries for a player."""
-    rows = query_rows(
-        """
+    rows = await aquery_rows(
+        f"""
         SELECT player_id, analyst_id, prompt_text, draft_sql, final_sql, purpose, result_summary,
-               result_columns, result_rows, row_count, duration_ms, created_at
+               result_columns, result_rows, row_count, duration_ms,
+               {iso_sql('created_at')} AS created_at
         FROM rg_query_log
         WHERE player_id = ?
         ORDER BY created_at DESC
@@ -123,11 +133,11 @@ async def get_query_logs(
             final_sql=row["final_sql"],
             purpose=row["purpose"],
             result_summary=row["result_summary"],
-            result_columns=json.loads(row["result_columns"]) if row["result_columns"] else None,
-            result_rows=json.loads(row["result_rows"]) if row["result_rows"] else None,
+            result_columns=fastjson.loads(row["result_columns"]) if row["result_columns"] else None,
+            result_rows=fastjson.loads(row["result_rows"]) if row["result_rows"] else None,
             row_count=row["row_count"],
             duration_ms=row["duration_ms"],
-            created_at=str(row["created_at"]),
+            created_at=row["created_at"],
         )
         for row in rows
     ]
@@ -138,27 +148,29 @@ async def get_case_timeline(
     player_id: str, db_path: str = Depends(get_db_path)
 ) -> list[CaseTimelineEntry]:
     """Return unified case timeline for a player."""
-    notes_rows = query_rows(
-        """
-        SELECT analyst_action, analyst_notes, created_at
+    notes_rows = await aquery_rows(
+        f"""
+        SELECT analyst_action, analyst_notes,
+               {iso_sql('created_at')} AS created_at
         FROM rg_analyst_notes_log
         WHERE player_id = ?
         """,
         (player_id,),
         db_path=db_path,
     )
-    ai_rows = query_rows(
-        """
-        SELECT prompt_text, created_at
+    ai_rows = await aquery_rows(
+        f"""
+        SELECT prompt_text, {iso_sql('created_at')} AS created_at
         FROM rg_llm_prompt_log
         WHERE player_id = ?
         """,
         (player_id,),
         db_path=db_path,
     )
-    query_rows_data = query_rows(
-        """
-        SELECT purpose, result_summary, created_at
+    query_rows_data = await aquery_rows(
+        f"""
+        SELECT purpose, result_summary,
+               {iso_sql('created_at')} AS created_at
         FROM rg_query_log
         WHERE player_id = ?
         """,
@@ -172,7 +184,7 @@ async def get_case_timeline(
             CaseTimelineEntry(
                 event_type="Analyst note",
                 event_detail=f"{row['analyst_action']}: {row['analyst_notes']}",
-                created_at=str(row["created_at"]),
+                created_at=row["created_at"],
             )
         )
     for row in ai_rows:
@@ -180,7 +192,7 @@ async def get_case_timeline(
             CaseTimelineEntry(
                 event_type="AI draft",
                 event_detail=f"Prompt logged: {row['prompt_text']}",
-                created_at=str(row["created_at"]),
+                created_at=row["created_at"],
             )
         )
     for row in query_rows_data:
@@ -188,7 +200,7 @@ async def get_case_timeline(
             CaseTimelineEntry(
                 event_type="SQL query",
                 event_detail=f"{row['purpose']} — {row['result_summary']}",
-                created_at=str(row["created_at"]),
+                created_at=row["created_at"],
             )
         )
 
@@ -262,6 +274,47 @@ def _log_trigger_query(
     return created_at
 
 
+def _record_trigger_check(
+    *,
+    player_id: str,
+    analyst_id: str,
+    state: str,
+    triggered: bool,
+    reason: str,
+    sql_text: str,
+    purpose: str,
+    result_summary: str,
+    db_path: str,
+) -> str:
+    # Query-log and trigger-log rows are written together: one executor hop
+    # and one commit per check instead of two autocommitted inserts.
+    with transaction(db_path):
+        created_at = _log_trigger_query(
+            player_id=player_id,
+            analyst_id=analyst_id,
+            sql_text=sql_text,
+            purpose=purpose,
+            result_summary=result_summary,
+            db_path=db_path,
+        )
+        execute(
+            """
+            INSERT INTO rg_trigger_check_log (
+                player_id,
+                state,
+                triggered,
+                reason,
+                sql_text,
+                row_count,
+                created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (player_id, state, triggered, reason, sql_text, 1, created_at),
+            db_path=db_path,
+        )
+    return created_at
+
+
 def _get_state_for_player(player_id: str, db_path: str) -> str | None:
     staging_schema = _resolve_schema("stg_player_profiles", db_path)
     rows = query_rows(
@@ -281,9 +334,10 @@ async def trigger_check(
     player_id: str, force: bool = False, db_path: str = Depends(get_db_path)
 ) -> list[TriggerCheckResult]:
     """Run state-specific trigger checks and log results."""
-    cached = query_rows(
-        """
-        SELECT state, triggered, reason, sql_text, row_count, created_at
+    cached = await aquery_rows(
+        f"""
+        SELECT state, triggered, reason, sql_text, row_count,
+               {iso_sql('created_at')} AS created_at
         FROM (
             SELECT *,
                 ROW_NUMBER() OVER (
@@ -307,17 +361,17 @@ async def trigger_check(
                 reason=row["reason"],
                 sql_text=row["sql_text"],
                 row_count=int(row["row_count"]),
-                created_at=str(row["created_at"]),
+                created_at=row["created_at"],
             )
             for row in cached
         ]
 
-    state = _get_state_for_player(player_id, db_path)
+    state = await arun(_get_state_for_player, player_id, db_path)
     analyst_id = "Colby Reichenbach"
     results: list[TriggerCheckResult] = []
 
     if state == "MA":
-        staging_schema = _resolve_schema("stg_bet_logs", db_path)
+        staging_schema = await arun(_resolve_schema, "stg_bet_logs", db_path)
         sql_text = f"""
         WITH avg_90 AS (
             SELECT AVG(bet_amount) AS avg_bet
@@ -337,7 +391,7 @@ async def trigger_check(
         FROM avg_90
         CROSS JOIN recent_max
         """
-        rows = query_rows(sql_text, (player_id, player_id), db_path=db_path)
+        rows = await aquery_rows(sql_text, (player_id, player_id), db_path=db_path)
         avg_bet = float(rows[0]["avg_bet"]) if rows and rows[0]["avg_bet"] is not None else 0.0
         max_bet = float(rows[0]["max_bet"]) if rows and rows[0]["max_bet"] is not None else 0.0
         triggered = avg_bet > 0 and max_bet > avg_bet * 10
@@ -347,29 +401,18 @@ async def trigger_check(
             else "No 90-day betting history available."
         )
         summary = f"MA abnormal play check: {'TRIGGERED' if triggered else 'Not triggered'}. {reason}"
-        created_at = _log_trigger_query(
+        created_at = await arun(
+            _record_trigger_check,
             player_id=player_id,
             analyst_id=analyst_id,
+            state="MA",
+            triggered=triggered,
+            reason=reason,
             sql_text=sql_text.strip(),
             purpose="Regulatory Trigger Check - MA",
             result_summary=summary,
             db_path=db_path,
         )
-        execute(
-            """
-            INSERT INTO rg_trigger_check_log (
-                player_id,
-                state,
-                triggered,
-                reason,
-                sql_text,
-                row_count,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (player_id, "MA", triggered, reason, sql_text.strip(), 1, created_at),
-            db_path=db_path,
-        )
         results.append(
             TriggerCheckResult(
                 state="MA",
@@ -382,7 +425,7 @@ async def trigger_check(
         )
 
     if state == "NJ":
-        risk_schema = _resolve_schema("rg_risk_scores", db_path)
+        risk_schema = await arun(_resolve_schema, "rg_risk_scores", db_path)
         sql_text = f"""
         SELECT COUNT(*) AS flag_count
         FROM {risk_schema}.RG_RISK_SCORES
@@ -390,34 +433,23 @@ async def trigger_check(
           AND risk_category IN ('HIGH', 'CRITICAL')
           AND CAST(calculated_at AS TIMESTAMP) >= CAST(CURRENT_TIMESTAMP AS TIMESTAMP) - INTERVAL '30 days'
         """
-        rows = query_rows(sql_text, (player_id,), db_path=db_path)
+        rows = await aquery_rows(sql_text, (player_id,), db_path=db_path)
         flag_count = int(rows[0]["flag_count"]) if rows else 0
         triggered = flag_count >= 3
         reason = f"{flag_count} high/critical flags in last 30 days."
         summary = f"NJ multi-flag check: {'TRIGGERED' if triggered else 'Not triggered'}. {reason}"
-        created_at = _log_trigger_query(
+        created_at = await arun(
+            _record_trigger_check,
             player_id=player_id,
             analyst_id=analyst_id,
+            state="NJ",
+            triggered=triggered,
+            reason=reason,
             sql_text=sql_text.strip(),
             purpose="Regulatory Trigger Check - NJ",
             result_summary=summary,
             db_path=db_path,
         )
-        execute(
-            """
-            INSERT INTO rg_trigger_check_log (
-                player_id,
-                state,
-                triggered,
-                reason,
-                sql_text,
-                row_count,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (player_id, "NJ", triggered, reason, sql_text.strip(), 1, created_at),
-            db_path=db_path,
-        )
         results.append(
             TriggerCheckResult(
                 state="NJ",
@@ -431,7 +463,7 @@ async def trigger_check(
 
     if state == "PA":
         sql_text = "SELECT 0 AS self_exclusion_reversals"
-        rows = query_rows(sql_text, db_path=db_path)
+        rows = await aquery_rows(sql_text, db_path=db_path)
         reversals = int(rows[0]["self_exclusion_reversals"]) if rows else 0
         triggered = reversals >= 3
         reason = (
@@ -440,29 +472,18 @@ async def trigger_check(
             else f"{reversals} reversals detected in 6 months."
         )
         summary = f"PA referral check: {'TRIGGERED' if triggered else 'Not triggered'}. {reason}"
-        created_at = _log_trigger_query(
+        created_at = await arun(
+            _record_trigger_check,
             player_id=player_id,
             analyst_id=analyst_id,
+            state="PA",
+            triggered=triggered,
+            reason=reason,
             sql_text=sql_text.strip(),
             purpose="Regulatory Trigger Check - PA",
             result_summary=summary,
             db_path=db_path,
         )
-        execute(
-            """
-            INSERT INTO rg_trigger_check_log (
-                player_id,
-                state,
-                triggered,
-                reason,
-                sql_text,
-                row_count,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (player_id, "PA", triggered, reason, sql_text.strip(), 1, created_at),
-            db_path=db_path,
-        )
         results.append(
             TriggerCheckResult(
                 state="PA",
@@ -483,12 +504,12 @@ async def start_case(
 ) -> CaseStatusEntry:
     """Mark a case as in progress."""
     now = datetime.utcnow().isoformat()
-    execute(
+    await aexecute(
         "DELETE FROM rg_case_status_log WHERE case_id = ?",
         (payload.case_id,),
         db_path=db_path,
     )
-    execute(
+    await aexecute(
         """
         INSERT INTO rg_case_status_log (
             case_id,
@@ -511,7 +532,7 @@ async def start_case(
         ),
         db_path=db_path,
     )
-    execute(
+    await aexecute(
         """
         UPDATE rg_queue_cases
         SET status = 'REMOVED'
@@ -538,12 +559,12 @@ async def submit_case(
 ) -> CaseStatusEntry:
     """Mark a case as submitted."""
     now = datetime.utcnow().isoformat()
-    execute(
+    await aexecute(
         "DELETE FROM rg_case_status_log WHERE case_id = ?",
         (payload.case_id,),
         db_path=db_path,
     )
-    execute(
+    await aexecute(
         """
         INSERT INTO rg_case_status_log (
             case_id,
@@ -578,7 +599,7 @@ async def submit_case(
         ),
         db_path=db_path,
     )
-    execute(
+    await aexecute(
         """
         UPDATE rg_queue_cases
         SET status = 'REMOVED'
@@ -588,8 +609,8 @@ async def submit_case(
         db_path=db_path,
     )
 
-    started_row = query_rows(
-        "SELECT started_at FROM rg_case_status_log WHERE case_id = ?",
+    started_row = await aquery_rows(
+        f"SELECT {iso_sql('started_at')} AS started_at FROM rg_case_status_log WHERE case_id = ?",
         (payload.case_id,),
         db_path=db_path,
     )
@@ -616,7 +637,7 @@ async def submit_case(
         player_id=payload.player_id,
         analyst_id=payload.analyst_id,
         status=STATUS_SUBMITTED,
-        started_at=str(started_at) if started_at else None,
+        started_at=started_at,
         submitted_at=now,
         updated_at=now,
     )
@@ -625,9 +646,16 @@ async def submit_case(
 @router.get("/status", response_model=list[CaseStatusEntry])
 async def list_case_status(db_path: str = Depends(get_db_path)) -> list[CaseStatusEntry]:
     """Return all case statuses."""
-    rows = query_rows(
-        """
-        SELECT case_id, player_id, analyst_id, status, started_at, submitted_at, updated_at
+    rows = await aquery_rows(
+        f"""
+        SELECT
+            case_id,
+            player_id,
+            analyst_id,
+            status,
+            {iso_sql('started_at')} AS started_at,
+            {iso_sql('submitted_at')} AS submitted_at,
+            {iso_sql('updated_at')} AS updated_at
         FROM rg_case_status_log
         """,
         db_path=db_path,
@@ -638,9 +666,9 @@ async def list_case_status(db_path: str = Depends(get_db_path)) -> list[CaseStat
             player_id=row["player_id"],
             analyst_id=row["analyst_id"],
             status=row["status"],
-            started_at=str(row["started_at"]) if row["started_at"] else None,
-            submitted_at=str(row["submitted_at"]) if row["submitted_at"] else None,
-            updated_at=str(row["updated_at"]),
+            started_at=row["started_at"],
+            submitted_at=row["submitted_at"],
+            updated_at=row["updated_at"],
         )
         for row in rows
     ]
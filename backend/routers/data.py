@@ -2,52 +2,79 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+import os
+import threading
+import time
+from functools import lru_cache
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
-
-from backend.db.duckdb_client import execute, get_db_path, query_rows
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+
+from backend.db.duckdb_client import (
+    aquery_rows,
+    arun,
+    clear_statement_cache,
+    data_version,
+    execute,
+    execute_many,
+    get_connection,
+    get_db_path,
+    query_columns_cached,
+    query_rows,
+    query_rows_cached,
+    transaction,
+)
 from backend.models.analytics import AnalyticsSummary, FunnelCounts, RiskMix
+from backend.models.hitl import AnalystNoteResponse, PromptLogEntry
 from backend.models.risk_data import AuditTrailEntry, CaseDetail, CaseFileResponse, RiskCase
 from backend.routers.cases import get_case_timeline, get_query_logs, trigger_check
 from backend.routers.interventions import get_latest_notes
+from backend.utils.stamps import iso_sql, now_iso
+from backend.utils.ttl_cache import TTLCache
 
 router = APIRouter()
 
+_BASE_ACTIONS = ("Provide Responsible Gaming Resources (RG Center)",)
+_CATEGORY_ACTIONS = {
+    "CRITICAL": (
+        "Immediate analyst review (within 2 hours)",
+        "Supportive nudge + timeout offer",
+        "Escalate for senior review (manual limits/exclusion)",
+    ),
+    "HIGH": (
+        "Supportive nudge (within 24 hours)",
+        "Offer Player Limits (Deposit/Wager/Time)",
+        "Offer Cool Off Period",
+    ),
+    "MEDIUM": (
+        "Watchlist + weekly check-in",
+        "Optional check-in message",
+    ),
+    "LOW": (
+        "Monitor only (no intervention)",
+        "Document only (optional)",
+    ),
+}
+_STATE_ACTIONS = {
+    "NJ": "Refer for mandatory 24-hour timeout + commission notification (if NJ trigger)",
+    "PA": "Refer to PA Problem Gambling Council + 72-hour cooling period (if PA trigger)",
+    "MA": "Internal documentation + analyst review (if MA trigger)",
+}
+# Every (category, state) combination is known up front, so build them once.
+_ACTIONS = {
+    (category, state): _BASE_ACTIONS
+    + category_actions
+    + ((_STATE_ACTIONS[state],) if state else ())
+    for category, category_actions in _CATEGORY_ACTIONS.items()
+    for state in (None, *_STATE_ACTIONS)
+}
+
+
 def _action_recommendations(risk_category: str, state: str | None) -> list[str]:
-    base = ["Provide Responsible Gaming Resources (RG Center)"]
-    if risk_category == "CRITICAL":
-        base += [
-            "Immediate analyst review (within 2 hours)",
-            "Supportive nudge + timeout offer",
-            "Escalate for senior review (manual limits/exclusion)",
-        ]
-    elif risk_category == "HIGH":
-        base += [
-            "Supportive nudge (within 24 hours)",
-            "Offer Player Limits (Deposit/Wager/Time)",
-            "Offer Cool Off Period",
-        ]
-    elif risk_category == "MEDIUM":
-        base += [
-            "Watchlist + weekly check-in",
-            "Optional check-in message",
-        ]
-    else:
-        base += [
-            "Monitor only (no intervention)",
-            "Document only (optional)",
-        ]
-
-    if state == "NJ":
-        base.append("Refer for mandatory 24-hour timeout + commission notification (if NJ trigger)")
-    elif state == "PA":
-        base.append("Refer to PA Problem Gambling Council + 72-hour cooling period (if PA trigger)")
-    elif state == "MA":
-        base.append("Internal documentation + analyst review (if MA trigger)")
-
-    return base
+    category = risk_category if risk_category in _CATEGORY_ACTIONS else "LOW"
+    return list(_ACTIONS[(category, state if state in _STATE_ACTIONS else None)])
+
 
 _REGULATORY_NOTES = {
     "MA": "MA abnormal-play review pending (10x rolling avg check).",
@@ -66,8 +93,265 @@ _QUEUE_MIX = (
     ("LOW", 5),
 )
 
+# Dashboards poll /queue and /analytics/summary; keys carry data_version() so
+# any write invalidates them before the TTL runs out.
+_RESPONSE_CACHE = TTLCache(maxsize=32, ttl=float(os.getenv("API_CACHE_TTL_SECONDS", "5")))
+
+# Pre-aggregated summary counts, rebuilt in the background when
+# data_version() moves on or the TTL runs out (writes from other processes,
+# such as seed scripts or dbt, never move data_version()).
+_SUMMARY_CACHE_LOCK = threading.Lock()
+_SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "30"))
+# db_path -> (data_version, time.monotonic()) of the last rebuild
+_SUMMARY_CACHE_BUILT: dict[str, tuple[int, float]] = {}
+
+
+_PRUNE_QUEUE_SQL = """
+    DELETE FROM rg_queue_cases q
+    WHERE q.status = 'QUEUED'
+      AND NOT EXISTS (
+          SELECT 1
+          FROM {risk_schema}.RG_RISK_SCORES r
+          WHERE r.player_id = q.player_id
+      )
+"""
+
+_CANDIDATES_SQL = """
+    SELECT
+        r.player_id,
+        r.composite_risk_score,
+        r.risk_category,
+        r.calculated_at,
+        r.loss_chase_score,
+        r.bet_escalation_score,
+        r.market_drift_score,
+        r.temporal_risk_score,
+        r.gamalyze_risk_score,
+        ROW_NUMBER() OVER (
+            PARTITION BY r.risk_category
+            ORDER BY r.composite_risk_score DESC, r.calculated_at DESC
+        ) AS category_rank,
+        ROW_NUMBER() OVER (
+            ORDER BY r.composite_risk_score DESC, r.calculated_at DESC
+        ) AS overall_rank
+    FROM {risk_schema}.RG_RISK_SCORES r
+    LEFT JOIN rg_queue_cases q
+      ON r.player_id = q.player_id AND q.status = 'QUEUED'
+    LEFT JOIN rg_case_status_log s
+      ON r.player_id = s.player_id
+    WHERE q.player_id IS NULL
+      AND s.player_id IS NULL
+    QUALIFY category_rank <= CASE r.risk_category {category_limits} ELSE 0 END
+         OR overall_rank <= ?
+    ORDER BY overall_rank
+"""
+
+_QUEUE_SQL = """
+    SELECT
+        COALESCE(q.case_id, 'CASE-' || q.player_id) AS case_id,
+        q.player_id,
+        q.assigned_at,
+        COALESCE(r.composite_risk_score, 0.0) AS composite_risk_score,
+        COALESCE(r.risk_category, 'LOW') AS risk_category,
+        {calculated_at} AS calculated_at,
+        -- Top three signals, highest first; ties keep the listed order.
+        list_transform(
+          list_sort(
+            [
+              {{'score': COALESCE(r.loss_chase_score, 0.0), 'ord': -1, 'label': 'Loss chase'}},
+              {{'score': COALESCE(r.bet_escalation_score, 0.0), 'ord': -2, 'label': 'Bet escalation'}},
+              {{'score': COALESCE(r.market_drift_score, 0.0), 'ord': -3, 'label': 'Market drift'}},
+              {{'score': COALESCE(r.temporal_risk_score, 0.0), 'ord': -4, 'label': 'Temporal risk'}},
+              {{'score': COALESCE(r.gamalyze_risk_score, 0.0), 'ord': -5, 'label': 'Gamalyze'}}
+            ],
+            'DESC'
+          )[1:3],
+          e -> e.label || ' ' || printf('%.2f', e.score)
+        ) AS key_evidence,
+        p.state_jurisdiction
+    FROM rg_queue_cases q
+    LEFT JOIN {schema}.RG_RISK_SCORES r
+      ON q.player_id = r.player_id
+    LEFT JOIN {staging}.STG_PLAYER_PROFILES p
+      ON q.player_id = p.player_id
+    WHERE q.status = 'QUEUED'
+    ORDER BY q.assigned_at DESC
+    LIMIT ?
+"""
+
+_QUEUE_CALCULATED_AT = iso_sql(
+    "COALESCE(CAST(r.calculated_at AS TIMESTAMP), CAST(q.assigned_at AS TIMESTAMP))"
+)
+
+_CASE_DETAIL_SQL = f"""
+    WITH score AS (
+        SELECT
+            r.player_id,
+            r.composite_risk_score,
+            r.risk_category,
+            {iso_sql('CAST(r.calculated_at AS TIMESTAMP)')} AS calculated_at,
+            r.loss_chase_score,
+            r.bet_escalation_score,
+            r.market_drift_score,
+            r.temporal_risk_score,
+            r.gamalyze_risk_score,
+            p.state_jurisdiction
+        FROM {{schema}}.RG_RISK_SCORES r
+        LEFT JOIN {{staging}}.STG_PLAYER_PROFILES p
+          ON r.player_id = p.player_id
+        WHERE r.player_id = ?
+    ),
+    ref AS (
+        SELECT
+            COALESCE(
+                MAX(bet_timestamp),
+                CAST(CURRENT_TIMESTAMP AS TIMESTAMP)
+            ) AS as_of_ts
+        FROM {{bets}}.STG_BET_LOGS
+    ),
+    bets AS (
+        SELECT
+            COUNT(*) AS total_bets_7d,
+            COALESCE(SUM(bet_amount), 0) AS total_wagered_7d
+        FROM {{bets}}.STG_BET_LOGS, ref
+        WHERE player_id = ?
+          AND bet_timestamp >= ref.as_of_ts - INTERVAL '7 days'
+          AND bet_timestamp <= ref.as_of_ts
+    )
+    SELECT score.*, bets.total_bets_7d, bets.total_wagered_7d
+    FROM score, bets
+"""
+
+_AUDIT_TRAIL_SQL = f"""
+    WITH latest_notes AS (
+        SELECT
+            player_id,
+            ARG_MAX(analyst_action, created_at) AS analyst_action,
+            ARG_MAX(analyst_notes, created_at) AS analyst_notes,
+            MAX(created_at) AS created_at
+        FROM rg_analyst_notes_log
+        GROUP BY player_id
+    ),
+    latest_nudge AS (
+        SELECT
+            player_id,
+            ARG_MAX(final_nudge, created_at) AS final_nudge,
+            ARG_MAX(validation_status, created_at) AS validation_status,
+            MAX(created_at) AS created_at
+        FROM rg_nudge_log
+        GROUP BY player_id
+    )
+    SELECT
+        s.case_id,
+        s.player_id,
+        s.analyst_id,
+        s.status,
+        {iso_sql('s.updated_at')} AS updated_at,
+        r.risk_category,
+        p.state_jurisdiction,
+        n.analyst_action,
+        n.analyst_notes,
+        {iso_sql('n.created_at')} AS note_created_at,
+        ng.final_nudge AS nudge_text,
+        ng.validation_status AS nudge_status,
+        {iso_sql('ng.created_at')} AS nudge_created_at
+    FROM rg_case_status_log s
+    LEFT JOIN {{risk_schema}}.RG_RISK_SCORES r
+      ON s.player_id = r.player_id
+    LEFT JOIN {{staging_schema}}.STG_PLAYER_PROFILES p
+      ON s.player_id = p.player_id
+    LEFT JOIN latest_notes n
+      ON s.player_id = n.player_id
+    LEFT JOIN latest_nudge ng
+      ON s.player_id = ng.player_id
+    ORDER BY s.updated_at DESC
+    LIMIT ?
+"""
+
+_SUMMARY_COUNTS_SQL = """
+    WITH status AS (
+        SELECT
+            COUNT(*) AS started,
+            COUNT(*) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress,
+            COUNT(*) FILTER (WHERE status = 'SUBMITTED') AS submitted,
+            COUNT(DISTINCT player_id) AS cases_distinct,
+            AVG(DATE_DIFF('minute', started_at, submitted_at)) FILTER (
+                WHERE status = 'SUBMITTED'
+                  AND started_at IS NOT NULL
+                  AND submitted_at IS NOT NULL
+            ) / 60.0 AS avg_submit_hours
+        FROM rg_case_status_log
+    ),
+    sql_stats AS (
+        SELECT COUNT(*) AS sql_total, COUNT(DISTINCT player_id) AS sql_cases
+        FROM rg_query_log
+    ),
+    llm_stats AS (
+        SELECT COUNT(*) AS llm_total, COUNT(DISTINCT player_id) AS llm_cases
+        FROM rg_llm_prompt_log
+    ),
+    risk_mix AS (
+        SELECT
+            COUNT(*) FILTER (WHERE UPPER(r.risk_category) = 'CRITICAL') AS risk_critical,
+            COUNT(*) FILTER (WHERE UPPER(r.risk_category) = 'HIGH') AS risk_high,
+            COUNT(*) FILTER (WHERE UPPER(r.risk_category) = 'MEDIUM') AS risk_medium,
+            COUNT(*) FILTER (WHERE UPPER(r.risk_category) = 'LOW') AS risk_low
+        FROM rg_case_status_log s
+        LEFT JOIN {risk_schema}.RG_RISK_SCORES r
+          ON s.player_id = r.player_id
+    ),
+    queue AS (
+        SELECT COUNT(*) AS queued_total FROM rg_queue_cases WHERE status = 'QUEUED'
+    ),
+    triggers AS (
+        SELECT COUNT(*) AS trigger_total FROM rg_trigger_check_log
+    ),
+    nudges AS (
+        SELECT COUNT(*) AS nudge_total FROM rg_nudge_log
+    )
+    SELECT *
+    FROM status, sql_stats, llm_stats, risk_mix, queue, triggers, nudges
+"""
+
+_SUMMARY_CACHE_SQL = (
+    "CREATE OR REPLACE TABLE rg_analytics_summary_cache AS" + _SUMMARY_COUNTS_SQL
+)
+
+# Time in progress depends on the clock, so it is always computed live on
+# top of the counts ({counts} is the cache table or the live counts query).
+_SUMMARY_SQL = """
+    WITH progress_avg AS (
+        SELECT
+            AVG(DATE_DIFF('minute', started_at, CAST(CURRENT_TIMESTAMP AS TIMESTAMP))) / 60.0
+                AS avg_progress_hours
+        FROM rg_case_status_log
+        WHERE status = 'IN_PROGRESS'
+          AND started_at IS NOT NULL
+    )
+    SELECT c.*, p.avg_progress_hours
+    FROM {counts} c, progress_avg p
+"""
+
+
+@lru_cache(maxsize=32)
+def _with_risk_schema(template: str, risk_schema: str) -> str:
+    return template.format(risk_schema=risk_schema)
+
 
 def _resolve_schema(table_name: str, db_path: str) -> str:
+    return _cached_schema(table_name.lower(), db_path)
+
+
+def invalidate_schema_cache() -> None:
+    """Forget resolved schemas (e.g. after dbt rebuilds the warehouse)."""
+    _cached_schema.cache_clear()
+    clear_statement_cache()
+    _SUMMARY_CACHE_BUILT.clear()
+    _RESPONSE_CACHE.clear()
+
+
+@lru_cache(maxsize=64)
+def _cached_schema(table_name: str, db_path: str) -> str:
     rows = query_rows(
         """
         SELECT table_schema
@@ -88,24 +372,8 @@ def _case_id(player_id: str) -> str:
     return f"CASE-{player_id}"
 
 
-def _key_evidence(row: dict) -> list[str]:
-    def score(value: object) -> float:
-        if value is None:
-            return 0.0
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
-
-    scores = {
-        "Loss chase": score(row.get("loss_chase_score")),
-        "Bet escalation": score(row.get("bet_escalation_score")),
-        "Market drift": score(row.get("market_drift_score")),
-        "Temporal risk": score(row.get("temporal_risk_score")),
-        "Gamalyze": score(row.get("gamalyze_risk_score")),
-    }
-    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:3]
-    return [f"{label} {value:.2f}" for label, value in ranked]
+def _player_id(case_id: str) -> str:
+    return case_id.removeprefix("CASE-")
 
 
 def _queued_count(db_path: str) -> int:
@@ -122,178 +390,113 @@ def _safe_ratio(numerator: int, denominator: int) -> float:
     return min(1.0, float(numerator) / float(denominator))
 
 
-def _fetch_analytics_summary(db_path: str) -> AnalyticsSummary:
-    status_rows = query_rows(
-        """
-        SELECT
-            COUNT(*) AS started,
-            SUM(CASE WHEN status = 'IN_PROGRESS' THEN 1 ELSE 0 END) AS in_progress,
-            SUM(CASE WHEN status = 'SUBMITTED' THEN 1 ELSE 0 END) AS submitted
-        FROM rg_case_status_log
-        """,
-        db_path=db_path,
-    )
-    status = status_rows[0] if status_rows else {"started": 0, "in_progress": 0, "submitted": 0}
-
-    avg_submit_rows = query_rows(
-        """
-        SELECT
-            AVG(DATE_DIFF('minute', started_at, submitted_at)) / 60.0 AS avg_hours
-        FROM rg_case_status_log
-        WHERE status = 'SUBMITTED'
-          AND started_at IS NOT NULL
-          AND submitted_at IS NOT NULL
-        """,
-        db_path=db_path,
-    )
-    avg_submit = avg_submit_rows[0]["avg_hours"] if avg_submit_rows else 0.0
-    if avg_submit is None or avg_submit < 0:
-        avg_submit = 0.0
-
-    avg_progress_rows = query_rows(
-        """
-        SELECT
-            AVG(DATE_DIFF('minute', started_at, CAST(CURRENT_TIMESTAMP AS TIMESTAMP))) / 60.0 AS avg_hours
-        FROM rg_case_status_log
-        WHERE status = 'IN_PROGRESS'
-          AND started_at IS NOT NULL
-        """,
-        db_path=db_path,
+def _summary_cache_fresh(db_path: str) -> bool:
+    built = _SUMMARY_CACHE_BUILT.get(db_path)
+    return (
+        built is not None
+        and built[0] == data_version()
+        and time.monotonic() - built[1] < _SUMMARY_CACHE_TTL
     )
-    avg_progress = avg_progress_rows[0]["avg_hours"] if avg_progress_rows else 0.0
-    if avg_progress is None or avg_progress < 0:
-        avg_progress = 0.0
-
-    sql_rows = query_rows("SELECT COUNT(*) AS total FROM rg_query_log", db_path=db_path)
-    sql_total = int(sql_rows[0]["total"]) if sql_rows else 0
-
-    llm_rows = query_rows("SELECT COUNT(*) AS total FROM rg_llm_prompt_log", db_path=db_path)
-    llm_total = int(llm_rows[0]["total"]) if llm_rows else 0
 
-    case_count_rows = query_rows(
-        "SELECT COUNT(DISTINCT player_id) AS total FROM rg_case_status_log", db_path=db_path
-    )
-    total_cases_distinct = int(case_count_rows[0]["total"]) if case_count_rows else 0
 
-    sql_case_rows = query_rows(
-        "SELECT COUNT(DISTINCT player_id) AS total FROM rg_query_log", db_path=db_path
-    )
-    sql_cases = int(sql_case_rows[0]["total"]) if sql_case_rows else 0
+def _refresh_summary_cache(db_path: str) -> None:
+    # Runs as a background task after a stale read, never on the request path.
+    with _SUMMARY_CACHE_LOCK:
+        if _summary_cache_fresh(db_path):
+            return
+        # Stamp before the rebuild so writes that land mid-rebuild trigger another one.
+        built = (data_version(), time.monotonic())
+        risk_schema = _resolve_schema("rg_risk_scores", db_path)
+        with get_connection(db_path) as conn:
+            conn.execute(_with_risk_schema(_SUMMARY_CACHE_SQL, risk_schema))
+        _SUMMARY_CACHE_BUILT[db_path] = built
 
-    llm_case_rows = query_rows(
-        "SELECT COUNT(DISTINCT player_id) AS total FROM rg_llm_prompt_log", db_path=db_path
-    )
-    llm_cases = int(llm_case_rows[0]["total"]) if llm_case_rows else 0
 
+def _fetch_analytics_summary(db_path: str, use_cache: bool) -> AnalyticsSummary:
+    # A stale or missing cache table is bypassed for the live counts.
+    counts = "rg_analytics_summary_cache" if use_cache else "(" + _SUMMARY_COUNTS_SQL + ")"
     risk_schema = _resolve_schema("rg_risk_scores", db_path)
-    risk_rows = query_rows(
-        """
-        SELECT r.risk_category, COUNT(*) AS total
-        FROM rg_case_status_log s
-        LEFT JOIN {risk_schema}.RG_RISK_SCORES r
-          ON s.player_id = r.player_id
-        GROUP BY r.risk_category
-        """.format(risk_schema=risk_schema),
+    rows = query_rows(
+        _with_risk_schema(_SUMMARY_SQL.replace("{counts}", counts), risk_schema),
         db_path=db_path,
     )
-    risk_mix = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    for row in risk_rows:
-        category = (row.get("risk_category") or "").upper()
-        if category in risk_mix:
-            risk_mix[category] = int(row["total"])
-
-    queue_rows = query_rows(
-        "SELECT COUNT(*) AS total FROM rg_queue_cases WHERE status = 'QUEUED'", db_path=db_path
-    )
-    queued_total = int(queue_rows[0]["total"]) if queue_rows else 0
+    summary = rows[0] if rows else {}
 
-    trigger_rows = query_rows(
-        "SELECT COUNT(*) AS total FROM rg_trigger_check_log", db_path=db_path
-    )
-    trigger_total = int(trigger_rows[0]["total"]) if trigger_rows else 0
+    avg_submit = summary.get("avg_submit_hours")
+    if avg_submit is None or avg_submit < 0:
+        avg_submit = 0.0
+    avg_progress = summary.get("avg_progress_hours")
+    if avg_progress is None or avg_progress < 0:
+        avg_progress = 0.0
 
-    nudge_rows = query_rows("SELECT COUNT(*) AS total FROM rg_nudge_log", db_path=db_path)
-    nudge_total = int(nudge_rows[0]["total"]) if nudge_rows else 0
+    started = int(summary.get("started") or 0)
+    submitted = int(summary.get("submitted") or 0)
+    total_cases_distinct = int(summary.get("cases_distinct") or 0)
 
     return AnalyticsSummary(
-        total_cases_started=int(status.get("started") or 0),
-        total_cases_submitted=int(status.get("submitted") or 0),
-        in_progress_count=int(status.get("in_progress") or 0),
-        avg_time_to_submit_hours=float(avg_submit or 0.0),
-        avg_time_in_progress_hours=float(avg_progress or 0.0),
-        sql_queries_logged=sql_total,
-        llm_prompts_logged=llm_total,
-        cases_with_sql_pct=_safe_ratio(sql_cases, total_cases_distinct),
-        cases_with_llm_pct=_safe_ratio(llm_cases, total_cases_distinct),
+        total_cases_started=started,
+        total_cases_submitted=submitted,
+        in_progress_count=int(summary.get("in_progress") or 0),
+        avg_time_to_submit_hours=float(avg_submit),
+        avg_time_in_progress_hours=float(avg_progress),
+        sql_queries_logged=int(summary.get("sql_total") or 0),
+        llm_prompts_logged=int(summary.get("llm_total") or 0),
+        cases_with_sql_pct=_safe_ratio(int(summary.get("sql_cases") or 0), total_cases_distinct),
+        cases_with_llm_pct=_safe_ratio(int(summary.get("llm_cases") or 0), total_cases_distinct),
         risk_mix=RiskMix(
-            critical=risk_mix["CRITICAL"],
-            high=risk_mix["HIGH"],
-            medium=risk_mix["MEDIUM"],
-            low=risk_mix["LOW"],
+            critical=int(summary.get("risk_critical") or 0),
+            high=int(summary.get("risk_high") or 0),
+            medium=int(summary.get("risk_medium") or 0),
+            low=int(summary.get("risk_low") or 0),
         ),
-        trigger_checks_run=trigger_total,
-        nudges_validated=nudge_total,
+        trigger_checks_run=int(summary.get("trigger_total") or 0),
+        nudges_validated=int(summary.get("nudge_total") or 0),
         funnel=FunnelCounts(
-            queued=queued_total,
-            started=int(status.get("started") or 0),
-            submitted=int(status.get("submitted") or 0),
+            queued=int(summary.get("queued_total") or 0),
+            started=started,
+            submitted=submitted,
         ),
     )
 
 
 def _fetch_candidates(
     *,
-    category: str | None,
-    limit: int,
+    fallback_limit: int,
     db_path: str,
     risk_schema: str,
 ) -> list[dict]:
-    category_filter = "AND r.risk_category = ?" if category else ""
-    params = [category] if category else []
-    params.append(limit)
-    return query_rows(
-        """
-        SELECT
-            r.player_id,
-            r.composite_risk_score,
-            r.risk_category,
-            r.calculated_at,
-            r.loss_chase_score,
-            r.bet_escalation_score,
-            r.market_drift_score,
-            r.temporal_risk_score,
-            r.gamalyze_risk_score
-        FROM {risk_schema}.RG_RISK_SCORES r
-        LEFT JOIN rg_queue_cases q
-          ON r.player_id = q.player_id AND q.status = 'QUEUED'
-        LEFT JOIN rg_case_status_log s
-          ON r.player_id = s.player_id
-        WHERE q.player_id IS NULL
-          AND s.player_id IS NULL
-          {category_filter}
-        ORDER BY r.composite_risk_score DESC, r.calculated_at DESC
-        LIMIT ?
-        """.format(risk_schema=risk_schema, category_filter=category_filter),
+    """Return per-category and overall top candidates in one anti-join scan."""
+    params: list = []
+    for category, limit in _QUEUE_MIX:
+        params.extend([category, limit * 2])
+    params.append(fallback_limit)
+    return query_rows_cached(
+        "queue_candidates",
+        lambda: _CANDIDATES_SQL.format(
+            risk_schema=risk_schema,
+            category_limits=" ".join("WHEN ? THEN ?" for _ in _QUEUE_MIX),
+        ),
         tuple(params),
         db_path=db_path,
     )
 
 
 def _insert_queue_entries(rows: list[dict], batch_id: str, db_path: str) -> None:
-    assigned_at = datetime.utcnow().isoformat()
-    for row in rows:
-        execute(
-            """
-            INSERT INTO rg_queue_cases (
-                case_id,
-                player_id,
-                risk_category,
-                composite_risk_score,
-                assigned_at,
-                batch_id,
-                status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+    # Microsecond Python timestamp rather than the millisecond now() default.
+    assigned_at = now_iso()
+    execute_many(
+        """
+        INSERT INTO rg_queue_cases (
+            case_id,
+            player_id,
+            risk_category,
+            composite_risk_score,
+            assigned_at,
+            batch_id,
+            status
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
             (
                 _case_id(row["player_id"]),
                 row["player_id"],
@@ -302,27 +505,23 @@ def _insert_queue_entries(rows: list[dict], batch_id: str, db_path: str) -> None
                 assigned_at,
                 batch_id,
                 "QUEUED",
-            ),
-            db_path=db_path,
-        )
+            )
+            for row in rows
+        ],
+        db_path=db_path,
+    )
 
 
 def _prune_stale_queue_entries(db_path: str, risk_schema: str) -> None:
-    execute(
-        """
-        DELETE FROM rg_queue_cases q
-        WHERE q.status = 'QUEUED'
-          AND NOT EXISTS (
-              SELECT 1
-              FROM {risk_schema}.RG_RISK_SCORES r
-              WHERE r.player_id = q.player_id
-          )
-        """.format(risk_schema=risk_schema),
-        db_path=db_path,
-    )
+    execute(_with_risk_schema(_PRUNE_QUEUE_SQL, risk_schema), db_path=db_path)
 
 
 def _refill_queue_if_needed(db_path: str) -> None:
+    with transaction(db_path):
+        _refill_queue(db_path)
+
+
+def _refill_queue(db_path: str) -> None:
     risk_schema = _resolve_schema("rg_risk_scores", db_path)
     _prune_stale_queue_entries(db_path, risk_schema)
 
@@ -337,17 +536,25 @@ def _refill_queue_if_needed(db_path: str) -> None:
     selected: list[dict] = []
     selected_ids: set[str] = set()
 
+    # Fallback depth is sized for the worst case (nothing picked by the mix).
+    fallback_limit = max(target_add * 10, _QUEUE_TARGET)
+    candidates = _fetch_candidates(
+        fallback_limit=fallback_limit,
+        db_path=db_path,
+        risk_schema=risk_schema,
+    )
+
     for category, limit in _QUEUE_MIX:
         if len(selected) >= target_add:
             break
         added_for_category = 0
-        candidates = _fetch_candidates(
-            category=category,
-            limit=limit * 2,
-            db_path=db_path,
-            risk_schema=risk_schema,
+        category_rows = sorted(
+            (row for row in candidates if row["risk_category"] == category),
+            key=lambda row: row["category_rank"],
         )
-        for row in candidates:
+        for row in category_rows:
+            if row["category_rank"] > limit * 2:
+                break
             if row["player_id"] in selected_ids:
                 continue
             selected.append(row)
@@ -359,13 +566,9 @@ def _refill_queue_if_needed(db_path: str) -> None:
     remaining = target_add - len(selected)
     if remaining > 0:
         fallback_limit = max(remaining * 10, _QUEUE_TARGET)
-        candidates = _fetch_candidates(
-            category=None,
-            limit=fallback_limit,
-            db_path=db_path,
-            risk_schema=risk_schema,
-        )
         for row in candidates:
+            if row["overall_rank"] > fallback_limit:
+                break
             if row["player_id"] in selected_ids:
                 continue
             selected.append(row)
@@ -380,57 +583,62 @@ def _refill_queue_if_needed(db_path: str) -> None:
 @router.get("/queue", response_model=list[RiskCase])
 async def get_queue(limit: int = 200, db_path: str = Depends(get_db_path)) -> list[RiskCase]:
     """Return the analyst queue."""
-    _refill_queue_if_needed(db_path)
-    risk_schema = _resolve_schema("rg_risk_scores", db_path)
-    rows = query_rows(
-        """
-        SELECT
-            q.case_id,
-            q.player_id,
-            q.assigned_at,
-            COALESCE(r.composite_risk_score, 0.0) AS composite_risk_score,
-            COALESCE(r.risk_category, 'LOW') AS risk_category,
-            COALESCE(
-              CAST(r.calculated_at AS TIMESTAMP),
-              CAST(q.assigned_at AS TIMESTAMP)
-            ) AS calculated_at,
-            COALESCE(r.loss_chase_score, 0.0) AS loss_chase_score,
-            COALESCE(r.bet_escalation_score, 0.0) AS bet_escalation_score,
-            COALESCE(r.market_drift_score, 0.0) AS market_drift_score,
-            COALESCE(r.temporal_risk_score, 0.0) AS temporal_risk_score,
-            COALESCE(r.gamalyze_risk_score, 0.0) AS gamalyze_risk_score,
-            p.state_jurisdiction
-        FROM rg_queue_cases q
-        LEFT JOIN {schema}.RG_RISK_SCORES r
-          ON q.player_id = r.player_id
-        LEFT JOIN {staging}.STG_PLAYER_PROFILES p
-          ON q.player_id = p.player_id
-        WHERE q.status = 'QUEUED'
-        ORDER BY q.assigned_at DESC
-        LIMIT ?
-        """.format(schema=risk_schema, staging=_resolve_schema("stg_player_profiles", db_path)),
+    cached = _RESPONSE_CACHE.get(("queue", limit, db_path, data_version()))
+    if cached is not None:
+        return cached
+    await arun(_refill_queue_if_needed, db_path)
+    cache_key = ("queue", limit, db_path, data_version())
+    cols = await arun(
+        query_columns_cached,
+        "queue_list",
+        lambda: _QUEUE_SQL.format(
+            schema=_resolve_schema("rg_risk_scores", db_path),
+            staging=_resolve_schema("stg_player_profiles", db_path),
+            calculated_at=_QUEUE_CALCULATED_AT,
+        ),
         (limit,),
         db_path=db_path,
     )
 
-    return [
-        RiskCase(
-            case_id=row.get("case_id") or _case_id(row["player_id"]),
-            player_id=row["player_id"],
-            risk_category=row["risk_category"],
-            composite_risk_score=row["composite_risk_score"],
-            score_calculated_at=str(row["calculated_at"]),
-            state_jurisdiction=row.get("state_jurisdiction"),
-            key_evidence=_key_evidence(row),
+    # Rows come straight from our own warehouse, so skip per-row validation.
+    cases = [
+        RiskCase.model_construct(
+            case_id=case_id,
+            player_id=player_id,
+            risk_category=risk_category,
+            composite_risk_score=score,
+            score_calculated_at=calculated_at,
+            state_jurisdiction=state,
+            key_evidence=key_evidence,
+        )
+        for case_id, player_id, risk_category, score, calculated_at, state, key_evidence in zip(
+            cols["case_id"],
+            cols["player_id"],
+            cols["risk_category"],
+            cols["composite_risk_score"],
+            cols["calculated_at"],
+            cols["state_jurisdiction"],
+            cols["key_evidence"],
         )
-        for row in rows
     ]
+    _RESPONSE_CACHE.set(cache_key, cases)
+    return cases
 
 
 @router.get("/analytics/summary", response_model=AnalyticsSummary)
-async def get_analytics_summary(db_path: str = Depends(get_db_path)) -> AnalyticsSummary:
+async def get_analytics_summary(
+    background: BackgroundTasks, db_path: str = Depends(get_db_path)
+) -> AnalyticsSummary:
     """Return analyst performance summary metrics."""
-    return _fetch_analytics_summary(db_path)
+    cache_key = ("summary", db_path, data_version())
+    summary = _RESPONSE_CACHE.get(cache_key)
+    if summary is None:
+        use_cache = _summary_cache_fresh(db_path)
+        summary = await arun(_fetch_analytics_summary, db_path, use_cache)
+        _RESPONSE_CACHE.set(cache_key, summary)
+        if not use_cache:
+            background.add_task(arun, _refresh_summary_cache, db_path)
+    return summary
 
 
 @router.get("/case-detail/{case_id}", response_model=CaseDetail)
@@ -438,56 +646,22 @@ async def get_case_detail(
     case_id: str, db_path: str = Depends(get_db_path)
 ) -> CaseDetail:
     """Return detailed case data for a given case id."""
-    player_id = case_id.replace("CASE-", "")
-    risk_schema = _resolve_schema("rg_risk_scores", db_path)
-    score_rows = query_rows(
-        """
-        SELECT
-            r.player_id,
-            r.composite_risk_score,
-            r.risk_category,
-            r.calculated_at,
-            r.loss_chase_score,
-            r.bet_escalation_score,
-            r.market_drift_score,
-            r.temporal_risk_score,
-            r.gamalyze_risk_score,
-            p.state_jurisdiction
-        FROM {schema}.RG_RISK_SCORES r
-        LEFT JOIN {staging}.STG_PLAYER_PROFILES p
-          ON r.player_id = p.player_id
-        WHERE r.player_id = ?
-        """.format(schema=risk_schema, staging=_resolve_schema("stg_player_profiles", db_path)),
-        (player_id,),
+    player_id = _player_id(case_id)
+    rows = await arun(
+        query_rows_cached,
+        "case_detail",
+        lambda: _CASE_DETAIL_SQL.format(
+            schema=_resolve_schema("rg_risk_scores", db_path),
+            staging=_resolve_schema("stg_player_profiles", db_path),
+            bets=_resolve_schema("stg_bet_logs", db_path),
+        ),
+        (player_id, player_id),
         db_path=db_path,
     )
-    if not score_rows:
+    if not rows:
         raise HTTPException(status_code=404, detail="Case not found")
 
-    row = score_rows[0]
-    bet_rows = query_rows(
-        """
-        WITH ref AS (
-            SELECT
-                COALESCE(
-                    MAX(bet_timestamp),
-                    CAST(CURRENT_TIMESTAMP AS TIMESTAMP)
-                ) AS as_of_ts
-            FROM {staging}.STG_BET_LOGS
-        )
-        SELECT
-            COUNT(*) AS total_bets_7d,
-            COALESCE(SUM(bet_amount), 0) AS total_wagered_7d
-        FROM {staging}.STG_BET_LOGS, ref
-        WHERE player_id = ?
-          AND bet_timestamp >= ref.as_of_ts - INTERVAL '7 days'
-          AND bet_timestamp <= ref.as_of_ts
-        """.format(staging=_resolve_schema("stg_bet_logs", db_path)),
-        (player_id,),
-        db_path=db_path,
-    )
-    bets = bet_rows[0] if bet_rows else {"total_bets_7d": 0, "total_wagered_7d": 0}
-
+    row = rows[0]
     state = row.get("state_jurisdiction")
     regulatory_notes = _REGULATORY_NOTES.get(state or "", "Regulatory review pending.")
 
@@ -496,11 +670,11 @@ async def get_case_detail(
         player_id=player_id,
         risk_category=row["risk_category"],
         composite_risk_score=row["composite_risk_score"],
-        score_calculated_at=str(row["calculated_at"]),
+        score_calculated_at=row["calculated_at"],
         state_jurisdiction=state,
         evidence_snapshot={
-            "total_bets_7d": int(bets["total_bets_7d"]),
-            "total_wagered_7d": float(bets["total_wagered_7d"]),
+            "total_bets_7d": int(row["total_bets_7d"]),
+            "total_wagered_7d": float(row["total_wagered_7d"]),
             "loss_chase_score": float(row["loss_chase_score"]),
             "bet_escalation_score": float(row["bet_escalation_score"]),
             "market_drift_score": float(row["market_drift_score"]),
@@ -519,139 +693,115 @@ async def get_audit_trail(
     limit: int = 200, db_path: str = Depends(get_db_path)
 ) -> list[AuditTrailEntry]:
     """Return analyst-driven audit trail entries."""
-    risk_schema = _resolve_schema("rg_risk_scores", db_path)
-    staging_schema = _resolve_schema("stg_player_profiles", db_path)
-    rows = query_rows(
-        """
-        WITH latest_notes AS (
-            SELECT
-                player_id,
-                analyst_action,
-                analyst_notes,
-                created_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY player_id
-                    ORDER BY created_at DESC
-                ) AS rn
-            FROM rg_analyst_notes_log
+    cols = await arun(
+        query_columns_cached,
+        "audit_trail",
+        lambda: _AUDIT_TRAIL_SQL.format(
+            risk_schema=_resolve_schema("rg_risk_scores", db_path),
+            staging_schema=_resolve_schema("stg_player_profiles", db_path),
         ),
-        latest_nudge AS (
-            SELECT
-                player_id,
-                final_nudge,
-                validation_status,
-                created_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY player_id
-                    ORDER BY created_at DESC
-                ) AS rn
-            FROM rg_nudge_log
-        )
-        SELECT
-            s.case_id,
-            s.player_id,
-            s.analyst_id,
-            s.status,
-            s.started_at,
-            s.submitted_at,
-            s.updated_at,
-            r.risk_category,
-            p.state_jurisdiction,
-            n.analyst_action,
-            n.analyst_notes,
-            n.created_at AS note_created_at,
-            ng.final_nudge AS nudge_text,
-            ng.validation_status AS nudge_status,
-            ng.created_at AS nudge_created_at
-        FROM rg_case_status_log s
-        LEFT JOIN {risk_schema}.RG_RISK_SCORES r
-          ON s.player_id = r.player_id
-        LEFT JOIN {staging_schema}.STG_PLAYER_PROFILES p
-          ON s.player_id = p.player_id
-        LEFT JOIN latest_notes n
-          ON s.player_id = n.player_id AND n.rn = 1
-        LEFT JOIN latest_nudge ng
-          ON s.player_id = ng.player_id AND ng.rn = 1
-        ORDER BY s.updated_at DESC
-        LIMIT ?
-        """.format(risk_schema=risk_schema, staging_schema=staging_schema),
         (limit,),
         db_path=db_path,
     )
 
     results: list[AuditTrailEntry] = []
-    for row in rows:
-        status = row["status"]
-        action = row.get("analyst_action")
+    for (
+        case_id,
+        player_id,
+        analyst_id,
+        status,
+        updated_at,
+        risk_category,
+        state,
+        action,
+        notes,
+        note_created_at,
+        nudge_text,
+        nudge_status,
+    ) in zip(
+        cols["case_id"],
+        cols["player_id"],
+        cols["analyst_id"],
+        cols["status"],
+        cols["updated_at"],
+        cols["risk_category"],
+        cols["state_jurisdiction"],
+        cols["analyst_action"],
+        cols["analyst_notes"],
+        cols["note_created_at"],
+        cols["nudge_text"],
+        cols["nudge_status"],
+    ):
         if not action:
             action = "Submitted decision" if status == "SUBMITTED" else "Case review started"
-        notes = row.get("analyst_notes") or "No analyst notes yet."
-        timestamp = row.get("note_created_at") or row.get("updated_at")
-        nudge_text = row.get("nudge_text")
         nudge_excerpt = None
         if nudge_text:
             nudge_excerpt = nudge_text[:80]
             if len(nudge_text) > 80:
                 nudge_excerpt += "…"
         results.append(
-            AuditTrailEntry(
-                audit_id=str(row["case_id"]),
-                case_id=row["case_id"],
-                player_id=row["player_id"],
-                analyst_id=row.get("analyst_id"),
+            AuditTrailEntry.model_construct(
+                audit_id=case_id,
+                case_id=case_id,
+                player_id=player_id,
+                analyst_id=analyst_id,
                 action=action,
-                risk_category=row.get("risk_category") or "HIGH",
-                state_jurisdiction=row.get("state_jurisdiction"),
-                timestamp=str(timestamp),
-                notes=notes,
-                nudge_status=row.get("nudge_status"),
+                risk_category=risk_category or "HIGH",
+                state_jurisdiction=state,
+                timestamp=note_created_at or updated_at,
+                notes=notes or "No analyst notes yet.",
+                nudge_status=nudge_status,
                 nudge_excerpt=nudge_excerpt,
             )
         )
     return results
 
 
+async def _latest_note_or_none(player_id: str, db_path: str) -> AnalystNoteResponse | None:
+    try:
+        return await get_latest_notes(player_id, db_path)
+    except HTTPException:
+        return None
+
+
 @router.get("/case-file/{player_id}", response_model=CaseFileResponse)
 async def get_case_file(
     player_id: str, db_path: str = Depends(get_db_path)
 ) -> CaseFileResponse:
     """Return aggregated case file payload."""
-    case_detail = await get_case_detail(_case_id(player_id), db_path)
-    try:
-        latest_note = await get_latest_notes(player_id, db_path)
-    except HTTPException:
-        latest_note = None
-
-    prompt_logs = query_rows(
-        """
-        SELECT player_id, analyst_id, prompt_text, response_text, route_type, tool_used, created_at
-        FROM rg_llm_prompt_log
-        WHERE player_id = ?
-        ORDER BY created_at DESC
-        """,
-        (player_id,),
-        db_path=db_path,
+    # The five reads are independent, so run them side by side on the pool.
+    # trigger_check writes to rg_query_log/rg_trigger_check_log, so it runs
+    # afterwards and query_logs never sees this call's own trigger rows.
+    case_detail, latest_note, prompt_logs, query_logs, timeline = await asyncio.gather(
+        get_case_detail(_case_id(player_id), db_path),
+        _latest_note_or_none(player_id, db_path),
+        aquery_rows(
+            f"""
+            SELECT
+                player_id,
+                analyst_id,
+                prompt_text,
+                response_text,
+                route_type,
+                tool_used,
+                {iso_sql('created_at')} AS created_at
+            FROM rg_llm_prompt_log
+            WHERE player_id = ?
+            ORDER BY created_at DESC
+            """,
+            (player_id,),
+            db_path=db_path,
+        ),
+        get_query_logs(player_id, db_path),
+        get_case_timeline(player_id, db_path),
     )
-    query_logs = await get_query_logs(player_id, db_path)
-    timeline = await get_case_timeline(player_id, db_path)
     trigger_checks = await trigger_check(player_id, db_path=db_path)
 
-    return CaseFileResponse(
+    return CaseFileResponse.model_construct(
         case_detail=case_detail,
-        latest_note=latest_note.model_dump() if latest_note else None,
-        prompt_logs=[
-            {
-                "player_id": row["player_id"],
-                "analyst_id": row["analyst_id"],
-                "prompt_text": row["prompt_text"],
-                "response_text": row["response_text"],
-                "route_type": row.get("route_type"),
-                "tool_used": row.get("tool_used"),
-                "created_at": str(row["created_at"]),
-            }
-            for row in prompt_logs
-        ],
-        query_logs=[log.model_dump() for log in query_logs],
-        timeline=[entry.model_dump() for entry in timeline],
-        trigger_checks=[check.model_dump() for check in trigger_checks],
+        latest_note=latest_note,
+        prompt_logs=[PromptLogEntry.model_construct(**row) for row in prompt_logs],
+        query_logs=query_logs,
+        timeline=timeline,
+        trigger_checks=trigger_checks,
     )
@@ -2,13 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-import json
-from uuid import uuid4
-
 from fastapi import APIRouter, Depends, HTTPException
 
-from backend.db.duckdb_client import execute, get_db_path, query_rows
+from backend.db.duckdb_client import aexecute, aquery_rows, get_db_path
 from backend.models.hitl import (
     AnalystNoteRequest,
     AnalystNoteResponse,
@@ -17,6 +13,7 @@ from backend.models.hitl import (
     NudgeLogRequest,
     NudgeLogResponse,
 )
+from backend.utils.stamps import iso_sql, new_id, now_iso
 
 router = APIRouter()
 
@@ -34,22 +31,21 @@ async def submit_notes(
     Returns:
         Persisted analyst note response.
     """
-    created_at = datetime.utcnow().isoformat()
-    log_id = str(uuid4())
-
-    execute(
+    # created_at comes from Python: DuckDB's now() is the transaction start
+    # at millisecond precision, so back-to-back notes could tie in
+    # get_latest_notes.
+    created_at = now_iso()
+    await aexecute(
         """
         INSERT INTO rg_analyst_notes_log (
-            log_id,
             player_id,
             analyst_id,
             analyst_action,
             analyst_notes,
             created_at
-        ) VALUES (?, ?, ?, ?, ?, ?)
+        ) VALUES (?, ?, ?, ?, ?)
         """,
         (
-            log_id,
             payload.player_id,
             payload.analyst_id,
             payload.analyst_action,
@@ -59,7 +55,7 @@ async def submit_notes(
         db_path=db_path,
     )
 
-    return AnalystNoteResponse(
+    return AnalystNoteResponse.model_construct(
         player_id=payload.player_id,
         analyst_id=payload.analyst_id,
         analyst_action=payload.analyst_action,
@@ -81,13 +77,8 @@ async def submit_notes_draft(
     Returns:
         Persisted draft note response.
     """
-    updated_at = datetime.utcnow().isoformat()
-    execute(
-        "DELETE FROM rg_analyst_notes_draft WHERE player_id = ?",
-        (payload.player_id,),
-        db_path=db_path,
-    )
-    execute(
+    updated_at = now_iso()
+    await aexecute(
         """
         INSERT INTO rg_analyst_notes_draft (
             player_id,
@@ -96,6 +87,11 @@ async def submit_notes_draft(
             draft_action,
             updated_at
         ) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (player_id) DO UPDATE SET
+            analyst_id = excluded.analyst_id,
+            draft_notes = excluded.draft_notes,
+            draft_action = excluded.draft_action,
+            updated_at = excluded.updated_at
         """,
         (
             payload.player_id,
@@ -106,7 +102,7 @@ async def submit_notes_draft(
         ),
         db_path=db_path,
     )
-    return AnalystNoteDraftResponse(
+    return AnalystNoteDraftResponse.model_construct(
         player_id=payload.player_id,
         analyst_id=payload.analyst_id,
         draft_notes=payload.draft_notes,
@@ -131,9 +127,10 @@ async def get_latest_notes(
     Raises:
         HTTPException: If no notes exist for player.
     """
-    rows = query_rows(
-        """
-        SELECT player_id, analyst_id, analyst_action, analyst_notes, created_at
+    rows = await aquery_rows(
+        f"""
+        SELECT player_id, analyst_id, analyst_action, analyst_notes,
+               {iso_sql('created_at')} AS created_at
         FROM rg_analyst_notes_log
         WHERE player_id = ?
         ORDER BY created_at DESC
@@ -147,12 +144,12 @@ async def get_latest_notes(
         raise HTTPException(status_code=404, detail="No analyst notes found")
 
     row = rows[0]
-    return AnalystNoteResponse(
+    return AnalystNoteResponse.model_construct(
         player_id=row["player_id"],
         analyst_id=row["analyst_id"],
         analyst_action=row["analyst_action"],
         analyst_notes=row["analyst_notes"],
-        created_at=str(row["created_at"]),
+        created_at=row["created_at"],
     )
 
 
@@ -172,9 +169,10 @@ async def get_latest_notes_draft(
     Raises:
         HTTPException: If no draft exists for player.
     """
-    rows = query_rows(
-        """
-        SELECT player_id, analyst_id, draft_notes, draft_action, updated_at
+    rows = await aquery_rows(
+        f"""
+        SELECT player_id, analyst_id, draft_notes, draft_action,
+               {iso_sql('updated_at')} AS updated_at
         FROM rg_analyst_notes_draft
         WHERE player_id = ?
         ORDER BY updated_at DESC
@@ -188,12 +186,12 @@ async def get_latest_notes_draft(
         raise HTTPException(status_code=404, detail="No draft notes found")
 
     row = rows[0]
-    return AnalystNoteDraftResponse(
+    return AnalystNoteDraftResponse.model_construct(
         player_id=row["player_id"],
         analyst_id=row["analyst_id"],
         draft_notes=row["draft_notes"] or "",
         draft_action=row.get("draft_action") or "",
-        updated_at=str(row["updated_at"]),
+        updated_at=row["updated_at"],
     )
 
 
@@ -202,9 +200,9 @@ async def submit_nudge(
     payload: NudgeLogRequest, db_path: str = Depends(get_db_path)
 ) -> NudgeLogResponse:
     """Store analyst-edited nudge and validation results."""
-    created_at = datetime.utcnow().isoformat()
-    log_id = str(uuid4())
-    execute(
+    created_at = now_iso()
+    log_id = new_id()
+    await aexecute(
         """
         INSERT INTO rg_nudge_log (
             log_id,
@@ -215,7 +213,7 @@ async def submit_nudge(
             validation_status,
             validation_violations,
             created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ) VALUES (?, ?, ?, ?, ?, ?, to_json(?::VARCHAR[]), ?)
         """,
         (
             log_id,
@@ -224,13 +222,13 @@ async def submit_nudge(
             payload.draft_nudge,
             payload.final_nudge,
             payload.validation_status,
-            json.dumps(payload.validation_violations),
+            payload.validation_violations,
             created_at,
         ),
         db_path=db_path,
     )
 
-    return NudgeLogResponse(
+    return NudgeLogResponse.model_construct(
         player_id=payload.player_id,
         analyst_id=payload.analyst_id,
         draft_nudge=payload.draft_nudge,
@@ -246,9 +244,19 @@ async def get_latest_nudge(
     player_id: str, db_path: str = Depends(get_db_path)
 ) -> NudgeLogResponse:
     """Fetch latest analyst nudge for a player."""
-    rows = query_rows(
-        """
-        SELECT player_id, analyst_id, draft_nudge, final_nudge, validation_status, validation_violations, created_at
+    rows = await aquery_rows(
+        f"""
+        SELECT
+            player_id,
+            analyst_id,
+            draft_nudge,
+            final_nudge,
+            validation_status,
+            CASE
+                WHEN json_valid(validation_violations)
+                THEN from_json(validation_violations, '["VARCHAR"]')
+            END AS validation_violations,
+            {iso_sql('created_at')} AS created_at
         FROM rg_nudge_log
         WHERE player_id = ?
         ORDER BY created_at DESC
@@ -262,19 +270,13 @@ async def get_latest_nudge(
         raise HTTPException(status_code=404, detail="No nudge found")
 
     row = rows[0]
-    violations = []
-    if row.get("validation_violations"):
-        try:
-            violations = json.loads(row["validation_violations"])
-        except json.JSONDecodeError:
-            violations = []
-
-    return NudgeLogResponse(
+
+    return NudgeLogResponse.model_construct(
         player_id=row["player_id"],
         analyst_id=row["analyst_id"],
         draft_nudge=row["draft_nudge"],
         final_nudge=row["final_nudge"],
         validation_status=row["validation_status"],
-        validation_violations=violations,
-        created_at=str(row["created_at"]),
+        validation_violations=row["validation_violations"] or [],
+        created_at=row["created_at"],
     )
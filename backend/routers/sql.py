@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import os
 import re
 import time
-import json
 from difflib import get_close_matches
 from functools import lru_cache
-from datetime import datetime
-from uuid import uuid4
 
 import duckdb
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 
 from ai_services.snowflake_sql import validate_snowflake_sql
-from backend.db.duckdb_client import execute, get_connection, get_db_path, query_rows
+from backend.db.duckdb_client import (
+    arun,
+    data_version,
+    execute,
+    get_connection,
+    get_db_path,
+    query_rows,
+)
 from backend.models.queries import SqlExecuteRequest, SqlExecuteResponse
+from backend.utils import fastjson
 from backend.utils.pii import find_pii_column
+from backend.utils.stamps import new_id, now_iso
+from backend.utils.ttl_cache import TTLCache
 
 router = APIRouter()
 
@@ -24,6 +32,18 @@ _DISALLOWED = re.compile(
     r"\b(INSERT|UPDATE|DELETE|CREATE|DROP|ALTER|MERGE|TRUNCATE|GRANT|REVOKE)\b",
     re.IGNORECASE,
 )
+_SELECT_HEAD = re.compile(r"\s*(SELECT|WITH)", re.IGNORECASE)
+
+# Analysts often re-run the same draft while editing the write-up. Keys carry
+# data_version() so API writes to runtime tables invalidate them; warehouse
+# tables only change on dbt rebuilds, so a short TTL covers those.
+_RESULT_CACHE = TTLCache(maxsize=256, ttl=float(os.getenv("SQL_CACHE_TTL_SECONDS", "60")))
+# Results that depend on the clock (or randomness) are never cached.
+_VOLATILE_SQL = re.compile(
+    r"\b(CURRENT_TIMESTAMP|CURRENT_DATE|CURRENT_TIME|LOCALTIMESTAMP|LOCALTIME)\b"
+    r"|\b(NOW|TODAY|GET_CURRENT_TIMESTAMP|GET_CURRENT_TIME|RANDOM|UUID|GEN_RANDOM_UUID)\s*\(",
+    re.IGNORECASE,
+)
 
 _SCHEMA_CANDIDATES = ("PROD", "staging_prod", "STAGING_PROD", "staging_staging", "STAGING_STAGING")
 _ALLOWED_TABLES = (
@@ -36,78 +56,125 @@ _ALLOWED_TABLES = (
 _COLUMN_ERROR = re.compile(r'Referenced column \"(?P<column>[^\"]+)\" not found', re.IGNORECASE)
 _CANDIDATE_BINDINGS = re.compile(r"Candidate bindings: (?P<candidates>.+)", re.IGNORECASE)
 _DATEADD_PATTERN = re.compile(
-    r"DATEADD\s*\(\s*(?P<unit>'?\w+'?)\s*,\s*(?P<value>[^,]+)\s*,\s*(?P<expr>[^\)]+)\)",
+    r"DATEADD\s*\(\s*'?(?P<unit>\w+)'?\s*,\s*(?P<value>[^,]+)\s*,\s*(?P<expr>[^\)]+)\)",
     re.IGNORECASE,
 )
 _DATEDIFF_PATTERN = re.compile(
-    r"DATEDIFF\s*\(\s*(?P<unit>'?\w+'?)\s*,\s*(?P<start>[^,]+)\s*,\s*(?P<end>[^\)]+)\)",
+    r"DATEDIFF\s*\(\s*'?(?P<unit>\w+)'?\s*,\s*(?P<start>[^,]+)\s*,\s*(?P<end>[^\)]+)\)",
     re.IGNORECASE,
 )
 _DATETRUNC_PATTERN = re.compile(
-    r"DATE_TRUNC\s*\(\s*(?P<unit>'?\w+'?)\s*,\s*(?P<expr>[^\)]+)\)",
+    r"DATE_TRUNC\s*\(\s*'?(?P<unit>\w+)'?\s*,\s*(?P<expr>[^\)]+)\)",
     re.IGNORECASE,
 )
+_CURRENT_TS_PARENS = re.compile(r"CURRENT_TIMESTAMP\s*\(\s*\)", re.IGNORECASE)
+_CURRENT_TS_BARE = re.compile(r"\bCURRENT_TIMESTAMP\b", re.IGNORECASE)
+# Strings and comments are matched whole so parentheses or LIMIT inside them
+# are ignored when looking for a top-level LIMIT.
+_LIMIT_SCAN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|[()]|\bLIMIT\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# Same lexing for statement separators: a ';' only counts outside strings
+# and comments.
+_STATEMENT_SCAN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|;",
+    re.DOTALL,
+)
+_ROW_LIMIT = 200
+
+# Kept as one constant so every log write sends identical SQL text and
+# DuckDB can reuse the parsed statement.
+_QUERY_LOG_INSERT_SQL = """
+    INSERT INTO rg_query_log (
+        log_id,
+        player_id,
+        analyst_id,
+        prompt_text,
+        draft_sql,
+        final_sql,
+        purpose,
+        result_summary,
+        result_columns,
+        result_rows,
+        row_count,
+        duration_ms,
+        created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SNOWFLAKE_TOKENS = ("dateadd", "datediff", "date_trunc", "current_timestamp")
+_STAGING_PREFIX = re.compile(r"\bSTAGING\.", re.IGNORECASE)
+_PROD_PREFIX = re.compile(r"\bPROD\.", re.IGNORECASE)
+
+
+def invalidate_schema_cache() -> None:
+    """Forget resolved schemas and columns (e.g. after dbt rebuilds the warehouse)."""
+    _resolve_schemas.cache_clear()
+    _column_catalog.cache_clear()
+    _RESULT_CACHE.clear()
+
+
+def _preferred_schema(rows: list[dict], table_name: str) -> str:
+    available = [row["table_schema"] for row in rows if row["table_name"] == table_name]
+    for candidate in _SCHEMA_CANDIDATES:
+        if candidate in available:
+            return candidate
+    return available[0] if available else "PROD"
 
 
-def _resolve_schema(table_name: str, db_path: str) -> str:
+@lru_cache(maxsize=8)
+def _resolve_schemas(db_path: str) -> tuple[str, str]:
     rows = query_rows(
         """
-        SELECT table_schema
+        SELECT LOWER(table_name) AS table_name, table_schema
         FROM information_schema.tables
-        WHERE LOWER(table_name) = LOWER(?)
+        WHERE LOWER(table_name) IN ('stg_bet_logs', 'rg_risk_scores')
         """,
-        (table_name,),
         db_path=db_path,
     )
-    available = {row["table_schema"] for row in rows}
-    for candidate in _SCHEMA_CANDIDATES:
-        if candidate in available:
-            return candidate
-    return rows[0]["table_schema"] if rows else "PROD"
+    return _preferred_schema(rows, "stg_bet_logs"), _preferred_schema(rows, "rg_risk_scores")
 
 
 def _rewrite_schema(sql_text: str, db_path: str) -> str:
-    staging_schema = _resolve_schema("stg_bet_logs", db_path)
-    prod_schema = _resolve_schema("rg_risk_scores", db_path)
-    rewritten = re.sub(r"\bSTAGING\.", f"{staging_schema}.", sql_text, flags=re.IGNORECASE)
-    rewritten = re.sub(r"\bPROD\.", f"{prod_schema}.", rewritten, flags=re.IGNORECASE)
+    lowered = sql_text.lower()
+    if "staging." not in lowered and "prod." not in lowered:
+        return sql_text
+    staging_schema, prod_schema = _resolve_schemas(db_path)
+    rewritten = _STAGING_PREFIX.sub(f"{staging_schema}.", sql_text)
+    rewritten = _PROD_PREFIX.sub(f"{prod_schema}.", rewritten)
     return rewritten
 
 
-def _rewrite_snowflake_functions(sql_text: str) -> str:
-    normalized = re.sub(
-        r"CURRENT_TIMESTAMP\s*\(\s*\)",
-        "CURRENT_TIMESTAMP",
-        sql_text,
-        flags=re.IGNORECASE,
-    )
+def _dateadd(match: re.Match) -> str:
+    unit = match.group("unit").lower()
+    value = match.group("value").strip()
+    expr = match.group("expr").strip()
+    return f"date_add({expr}, INTERVAL '{value} {unit}')"
+
 
-    def _dateadd(match: re.Match) -> str:
-        unit = match.group("unit").strip().strip("'\"").lower()
-        value = match.group("value").strip()
-        expr = match.group("expr").strip()
-        return f"date_add({expr}, INTERVAL '{value} {unit}')"
+def _datediff(match: re.Match) -> str:
+    unit = match.group("unit").lower()
+    start = match.group("start").strip()
+    end = match.group("end").strip()
+    return f"datediff('{unit}', {start}, {end})"
 
-    def _datediff(match: re.Match) -> str:
-        unit = match.group("unit").strip().strip("'\"").lower()
-        start = match.group("start").strip()
-        end = match.group("end").strip()
-        return f"datediff('{unit}', {start}, {end})"
 
-    def _datetrunc(match: re.Match) -> str:
-        unit = match.group("unit").strip().strip("'\"").lower()
-        expr = match.group("expr").strip()
-        return f"date_trunc('{unit}', {expr})"
+def _datetrunc(match: re.Match) -> str:
+    unit = match.group("unit").lower()
+    expr = match.group("expr").strip()
+    return f"date_trunc('{unit}', {expr})"
 
+
+def _rewrite_snowflake_functions(sql_text: str) -> str:
+    lowered = sql_text.lower()
+    if not any(token in lowered for token in _SNOWFLAKE_TOKENS):
+        return sql_text
+    normalized = _CURRENT_TS_PARENS.sub("CURRENT_TIMESTAMP", sql_text)
     rewritten = _DATEADD_PATTERN.sub(_dateadd, normalized)
     rewritten = _DATEDIFF_PATTERN.sub(_datediff, rewritten)
     rewritten = _DATETRUNC_PATTERN.sub(_datetrunc, rewritten)
-    rewritten = re.sub(
-        r"\bCURRENT_TIMESTAMP\b",
-        "CAST(CURRENT_TIMESTAMP AS TIMESTAMP)",
-        rewritten,
-        flags=re.IGNORECASE,
-    )
+    rewritten = _CURRENT_TS_BARE.sub("CAST(CURRENT_TIMESTAMP AS TIMESTAMP)", rewritten)
     return rewritten
 
 
@@ -121,9 +188,30 @@ def _ensure_select_only(sql_text: str) -> None:
         raise HTTPException(status_code=400, detail="SQL is empty.")
     if _DISALLOWED.search(normalized):
         raise HTTPException(status_code=400, detail="Only SELECT queries are allowed.")
-    head = normalized.lstrip().upper()
-    if not (head.startswith("SELECT") or head.startswith("WITH")):
+    if not _SELECT_HEAD.match(normalized):
         raise HTTPException(status_code=400, detail="Only SELECT queries are allowed.")
+    if _statement_count(normalized) != 1:
+        raise HTTPException(status_code=400, detail="Only a single SELECT statement is allowed.")
+
+
+def _strip_comments(sql_text: str) -> str:
+    return _STATEMENT_SCAN.sub(
+        lambda match: " " if match.group(0).startswith(("--", "/*")) else match.group(0),
+        sql_text,
+    )
+
+
+def _statement_count(sql_text: str) -> int:
+    # duckdb 0.10 has no extract_statements: count the non-blank pieces
+    # between top-level ';' separators once comments are gone.
+    code = _strip_comments(sql_text)
+    count = 0
+    start = 0
+    for match in _STATEMENT_SCAN.finditer(code + ";"):
+        if match.group(0) == ";":
+            count += bool(code[start:match.start()].strip())
+            start = match.end()
+    return count
 
 
 def _reject_pii(sql_text: str) -> None:
@@ -138,9 +226,28 @@ def _reject_pii(sql_text: str) -> None:
         )
 
 
-def _apply_limit(sql_text: str, limit: int = 200) -> str:
-    normalized = _normalize_sql(sql_text)
-    return f"SELECT * FROM ({normalized}) AS query_result LIMIT {limit}"
+def _has_top_level_limit(sql_text: str) -> bool:
+    depth = 0
+    for match in _LIMIT_SCAN.finditer(sql_text):
+        token = match.group(0)
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif depth == 0 and token.upper() == "LIMIT":
+            return True
+    return False
+
+
+def _apply_limit(sql_text: str, limit: int = _ROW_LIMIT) -> str:
+    # Appending LIMIT (rather than wrapping in a subquery) keeps the plan flat
+    # so DuckDB can push the limit down; _run_query still caps the fetch.
+    # Comments are dropped first so a trailing "; -- note" cannot split the
+    # appended LIMIT into a statement of its own.
+    normalized = _normalize_sql(_strip_comments(sql_text))
+    if _has_top_level_limit(normalized):
+        return normalized
+    return f"{normalized}\nLIMIT {limit}"
 
 
 def _default_summary(row_count: int, duration_ms: int, columns: list[str]) -> str:
@@ -152,8 +259,16 @@ def _default_summary(row_count: int, duration_ms: int, columns: list[str]) -> st
     )
 
 
+def warm_column_catalog(db_path: str) -> None:
+    """Load the column catalog ahead of the first failed analyst query."""
+    if not _column_catalog(db_path):
+        # Warehouse not built yet; retry on the next lookup instead of
+        # caching an empty catalog.
+        _column_catalog.cache_clear()
+
+
 @lru_cache(maxsize=8)
-def _column_catalog(db_path: str) -> set[str]:
+def _column_catalog(db_path: str) -> tuple[str, ...]:
     rows = query_rows(
         """
         SELECT column_name
@@ -163,7 +278,7 @@ def _column_catalog(db_path: str) -> set[str]:
         tuple(_ALLOWED_TABLES),
         db_path=db_path,
     )
-    return {row["column_name"] for row in rows}
+    return tuple(sorted({row["column_name"] for row in rows}))
 
 
 def _format_column_error(message: str, db_path: str) -> str | None:
@@ -173,8 +288,7 @@ def _format_column_error(message: str, db_path: str) -> str | None:
     missing = match.group("column")
     candidates_match = _CANDIDATE_BINDINGS.search(message)
     candidates = candidates_match.group("candidates") if candidates_match else ""
-    all_columns = sorted(_column_catalog(db_path))
-    suggestions = get_close_matches(missing, all_columns, n=3, cutoff=0.6)
+    suggestions = get_close_matches(missing, _column_catalog(db_path), n=3, cutoff=0.6)
     detail = f"Unknown column '{missing}'."
     if candidates:
         detail += f" Candidate bindings: {candidates}."
@@ -187,9 +301,29 @@ def _format_column_error(message: str, db_path: str) -> str | None:
     return detail
 
 
+def _run_query(sql_text: str, db_path: str) -> tuple[list[str], list[list]]:
+    try:
+        with get_connection(db_path) as conn:
+            result = conn.execute(sql_text)
+            columns = [col[0] for col in result.description]
+            rows = list(map(list, result.fetchmany(_ROW_LIMIT)))
+    except duckdb.BinderException as exc:
+        detail = _format_column_error(str(exc), db_path)
+        if detail:
+            raise HTTPException(status_code=400, detail=detail) from exc
+        raise
+    return columns, rows
+
+
+def _insert_query_log(params: tuple, db_path: str) -> None:
+    execute(_QUERY_LOG_INSERT_SQL, params, db_path=db_path)
+
+
 @router.post("/sql/execute", response_model=SqlExecuteResponse)
 async def execute_sql(
-    payload: SqlExecuteRequest, db_path: str = Depends(get_db_path)
+    payload: SqlExecuteRequest,
+    background: BackgroundTasks,
+    db_path: str = Depends(get_db_path),
 ) -> SqlExecuteResponse:
     """Execute read-only SQL with guardrails and optional logging."""
     _ensure_select_only(payload.sql_text)
@@ -198,63 +332,42 @@ async def execute_sql(
     if violations:
         raise HTTPException(status_code=400, detail="; ".join(violations))
 
-    rewritten_sql = _rewrite_schema(payload.sql_text, db_path)
+    rewritten_sql = await arun(_rewrite_schema, payload.sql_text, db_path)
     rewritten_sql = _rewrite_snowflake_functions(rewritten_sql)
     executed_sql = _apply_limit(rewritten_sql)
     start = time.perf_counter()
-    try:
-        with get_connection(db_path) as conn:
-            result = conn.execute(executed_sql)
-            columns = [col[0] for col in result.description]
-            rows = [list(row) for row in result.fetchall()]
-    except duckdb.BinderException as exc:
-        detail = _format_column_error(str(exc), db_path)
-        if detail:
-            raise HTTPException(status_code=400, detail=detail) from exc
-        raise
+    if _VOLATILE_SQL.search(executed_sql):
+        columns, rows = await arun(_run_query, executed_sql, db_path)
+    else:
+        cache_key = (executed_sql, db_path, data_version())
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is None:
+            cached = await arun(_run_query, executed_sql, db_path)
+            _RESULT_CACHE.set(cache_key, cached)
+        columns, rows = cached
     duration_ms = int((time.perf_counter() - start) * 1000)
     row_count = len(rows)
     result_summary = payload.result_summary or _default_summary(row_count, duration_ms, columns)
 
     if payload.log:
-        created_at = datetime.utcnow().isoformat()
-        log_id = str(uuid4())
-        analyst_id = payload.analyst_id or "Colby Reichenbach"
-        prompt_text = payload.prompt_text or payload.purpose
-        execute(
-            """
-            INSERT INTO rg_query_log (
-                log_id,
-                player_id,
-                analyst_id,
-                prompt_text,
-                draft_sql,
-                final_sql,
-                purpose,
-                result_summary,
-                result_columns,
-                result_rows,
-                row_count,
-                duration_ms,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        background.add_task(
+            _insert_query_log,
             (
-                log_id,
+                new_id(),
                 payload.player_id,
-                analyst_id,
-                prompt_text,
+                payload.analyst_id or "Colby Reichenbach",
+                payload.prompt_text or payload.purpose,
                 payload.sql_text,
                 payload.sql_text,
                 payload.purpose,
                 result_summary,
-                json.dumps(columns),
-                json.dumps(rows[:10]),
+                fastjson.dumps(columns),
+                fastjson.dumps(rows[:10]),
                 row_count,
                 duration_ms,
-                created_at,
+                now_iso(),
             ),
-            db_path=db_path,
+            db_path,
         )
 
     return SqlExecuteResponse(
@@ -0,0 +1,28 @@
+"""JSON encode/decode helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -6,27 +6,31 @@ import re
 
 PII_FIELDS = {"first_name", "last_name", "email"}
 _EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
+_PII_FIELD_RE = re.compile(
+    r"\b(" + "|".join(re.escape(field) for field in sorted(PII_FIELDS)) + r")\b",
+    re.IGNORECASE,
+)
+# Email addresses and field names fused so redaction is a single scan.
+_REDACT_RE = re.compile(
+    rf"(?P<email>{_EMAIL_RE.pattern})|(?P<field>{_PII_FIELD_RE.pattern})",
+    re.IGNORECASE,
+)
+
+
+def _redaction(match: re.Match[str]) -> str:
+    if match.lastgroup == "email":
+        return "[REDACTED_EMAIL]"
+    return f"[REDACTED_{match.group('field').upper()}]"
 
 
 def redact_text(text: str) -> str:
     """Redact obvious PII patterns from free-form text."""
     if not text:
         return text
-    redacted = _EMAIL_RE.sub("[REDACTED_EMAIL]", text)
-    for field in PII_FIELDS:
-        redacted = re.sub(
-            rf"\b{re.escape(field)}\b",
-            f"[REDACTED_{field.upper()}]",
-            redacted,
-            flags=re.IGNORECASE,
-        )
-    return redacted
+    return _REDACT_RE.sub(_redaction, text)
 
 
 def find_pii_column(sql_text: str) -> str | None:
     """Return the first PII column referenced in SQL, if any."""
-    lowered = sql_text.lower()
-    for field in PII_FIELDS:
-        if re.search(rf"\b{re.escape(field)}\b", lowered):
-            return field
-    return None
+    match = _PII_FIELD_RE.search(sql_text)
+    return match.group(1).lower() if match else None
@@ -0,0 +1,31 @@
+"""Timestamp and identifier helpers for log writes and reads."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime
+
+
+def now_iso() -> str:
+    """Return the current UTC time as a naive ISO-8601 string."""
+    return datetime.utcfromtimestamp(time.time()).isoformat()
+
+
+def iso_sql(column: str) -> str:
+    """Return a DuckDB expression rendering a TIMESTAMP like ``now_iso``.
+
+    ``isoformat()`` leaves out the fraction when microseconds are zero, so
+    the projection does too and timestamps read back compare equal to the
+    strings handed out on write. NULL stays NULL.
+    """
+    return (
+        f"CASE WHEN microsecond({column}) % 1000000 = 0 "
+        f"THEN strftime({column}, '%Y-%m-%dT%H:%M:%S') "
+        f"ELSE strftime({column}, '%Y-%m-%dT%H:%M:%S.%f') END"
+    )
+
+
+def new_id() -> str:
+    """Return a random 128-bit log identifier as 32 hex characters."""
+    return os.urandom(16).hex()
@@ -1,40 +1,106 @@
 from __future__ import annotations
 
+import atexit
 import os
 import logging
-from typing import Any, Dict
+import queue
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List
 
-try:
-    from supabase import create_client, Client
-except Exception:  # pragma: no cover - optional dependency
-    create_client = None  # type: ignore
-    Client = None  # type: ignore
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+# Audit entries are queued and written by a background thread in batches so
+# request handlers never wait on a Supabase round-trip.
+_AUDIT_QUEUE: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+_AUDIT_BATCH_SIZE = 100
+_AUDIT_FLUSH_SECONDS = 0.5
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
 
-if not SUPABASE_URL or not SUPABASE_KEY or create_client is None:
-    logger.warning("Supabase not configured or client not installed; supabase writes disabled")
-    sb: Client | None = None
-else:
-    sb = create_client(SUPABASE_URL, SUPABASE_KEY)
+
+@lru_cache(maxsize=1)
+def _client() -> Client | None:
+    # Built on first audit write so importing the app (CLI tools, scripts)
+    # does not pay for the supabase import and HTTP client setup.
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_KEY")
+    try:
+        from supabase import create_client
+    except Exception:  # pragma: no cover - optional dependency
+        create_client = None  # type: ignore
+    if not url or not key or create_client is None:
+        logger.warning("Supabase not configured or client not installed; supabase writes disabled")
+        return None
+    return create_client(url, key)
 
 
 def insert_audit(entry: Dict[str, Any]) -> None:
-    """Insert an audit entry into Supabase table `rg_audit_trail`.
+    """Queue an audit entry for the Supabase table `rg_audit_trail`.
 
-    This is best-effort and will not raise on failure; failures are logged.
+    This is best-effort and will not raise on failure; entries are written in
+    batches by a background thread and failures are logged.
     """
-    if sb is None:
+    if _client() is None:
         logger.debug("Supabase client not initialized; skipping audit insert")
         return
 
+    _ensure_writer()
+    _AUDIT_QUEUE.put(entry)
+
+
+def flush_audits() -> None:
+    """Write any queued audit entries synchronously (e.g. on shutdown)."""
+    while True:
+        batch = _drain(timeout=None)
+        if not batch:
+            return
+        _write_batch(batch)
+
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_run_writer, name="supabase-audit", daemon=True)
+            _writer.start()
+            atexit.register(flush_audits)
+
+
+def _run_writer() -> None:
+    while True:
+        batch = _drain(timeout=_AUDIT_FLUSH_SECONDS)
+        if batch:
+            _write_batch(batch)
+
+
+def _drain(timeout: float | None) -> List[Dict[str, Any]]:
+    batch: List[Dict[str, Any]] = []
+    try:
+        if timeout is None:
+            batch.append(_AUDIT_QUEUE.get_nowait())
+        else:
+            batch.append(_AUDIT_QUEUE.get(timeout=timeout))
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            batch.append(_AUDIT_QUEUE.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+
+def _write_batch(batch: List[Dict[str, Any]]) -> None:
+    client = _client()
+    if client is None:
+        return
     try:
-        resp = sb.table("rg_audit_trail").insert(entry).execute()
+        resp = client.table("rg_audit_trail").insert(batch).execute()
         # client returns a response-like object with `.error` on failure
         if getattr(resp, "error", None):
             logger.error("Supabase insert error: %s", resp.error)
     except Exception:  # pragma: no cover - runtime guard
-        logger.exception("Failed to write audit entry to Supabase")
+        logger.exception("Failed to write %d audit entries to Supabase", len(batch))
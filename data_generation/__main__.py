@@ -7,10 +7,11 @@ Orchestrates the entire data generation pipeline:
 3. Generate bets with state machine
 4. Inject edge cases
 5. Run validation
-6. Export CSVs
+6. Export CSVs (or Parquet with --format parquet)
 
 Usage:
     python -m data_generation --output-dir data/ --validate
+    python -m data_generation --output-dir data/ --format parquet
 """
 
 import click
@@ -43,7 +44,12 @@ from .validation import validate_all
 @click.option('--n-players', default=TOTAL_PLAYERS, help='Number of players to generate')
 @click.option('--validate/--no-validate', default=True, help='Run statistical validation')
 @click.option('--seed', default=RANDOM_SEED, help='Random seed for reproducibility')
-def main(output_dir, n_players, validate, seed):
+@click.option('--n-jobs', default=None, type=int,
+              help='Worker processes for bet generation (default: CPU count)')
+@click.option('--format', 'output_format', default='csv',
+              type=click.Choice(['csv', 'parquet']),
+              help='Export file format (parquet is faster and typed)')
+def main(output_dir, n_players, validate, seed, n_jobs, output_format):
     """
     DK Sentinel Synthetic Data Generator
 
@@ -58,6 +64,8 @@ def main(output_dir, n_players, validate, seed):
     print(f"  Output: {output_dir}")
     print(f"  Validation: {'Enabled' if validate else 'Disabled'}")
     print(f"  Random seed: {seed}")
+    print(f"  Bet workers: {n_jobs or 'auto'}")
+    print(f"  Format: {output_format}")
     print()
 
     # Set global random seed
@@ -96,7 +104,7 @@ def main(output_dir, n_players, validate, seed):
     print("      (This may take 2-5 minutes for 10K players)\n")
     start_time = time.time()
 
-    bets_df = generate_bets_for_all_players(players_df)
+    bets_df = generate_bets_for_all_players(players_df, n_jobs=n_jobs)
 
     elapsed = time.time() - start_time
     print(f"\n✓ Completed in {elapsed:.1f}s ({elapsed/60:.1f} minutes)\n")
@@ -135,21 +143,21 @@ def main(output_dir, n_players, validate, seed):
         print("[5/6] Skipping validation (--no-validate)\n")
 
     # =========================================================================
-    # STEP 6: Export CSVs
+    # STEP 6: Export files
     # =========================================================================
-    print("[6/6] Exporting CSV files...")
+    print(f"[6/6] Exporting {output_format.upper()} files...")
     start_time = time.time()
 
     # Export players (without latent factors)
-    players_export_path = output_path / 'players.csv'
+    players_export_path = output_path / f'players.{output_format}'
     export_players_csv(players_df, str(players_export_path))
 
     # Export bets
-    bets_export_path = output_path / 'bets.csv'
+    bets_export_path = output_path / f'bets.{output_format}'
     export_bets_csv(bets_df, str(bets_export_path))
 
     # Export Gamalyze
-    gamalyze_export_path = output_path / 'gamalyze_scores.csv'
+    gamalyze_export_path = output_path / f'gamalyze_scores.{output_format}'
     export_gamalyze_csv(gamalyze_df, str(gamalyze_export_path))
 
     elapsed = time.time() - start_time
@@ -177,16 +185,16 @@ def main(output_dir, n_players, validate, seed):
         total_size = players_size + bets_size + gamalyze_size
 
         print(f"\nFile Sizes:")
-        print(f"  players.csv: {players_size:.2f} MB")
-        print(f"  bets.csv: {bets_size:.2f} MB")
-        print(f"  gamalyze_scores.csv: {gamalyze_size:.2f} MB")
+        print(f"  {players_export_path.name}: {players_size:.2f} MB")
+        print(f"  {bets_export_path.name}: {bets_size:.2f} MB")
+        print(f"  {gamalyze_export_path.name}: {gamalyze_size:.2f} MB")
         print(f"  Total: {total_size:.2f} MB")
     except:
         pass
 
     print("\n" + "=" * 70)
     print("Next Steps:")
-    print("  1. Review generated CSVs in", output_path.absolute())
+    print("  1. Review generated files in", output_path.absolute())
     print("  2. Load into Snowflake: COPY INTO commands")
     print("  3. Run dbt pipeline: dbt run")
     print("  4. Validate dbt tests: dbt test")
@@ -10,10 +10,14 @@ Generates ~500,000 bets across 10,000 players with realistic patterns:
 This is the most complex module in the data generation pipeline.
 """
 
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from .config import (
     START_DATE,
     END_DATE,
@@ -32,10 +36,9 @@ from .config import (
 )
 from .utils import (
     generate_bet_id,
-    format_timestamp,
     generate_realistic_odds,
-    round_to_cents,
-    sample_from_range
+    sample_from_range,
+    write_table
 )
 
 
@@ -43,6 +46,15 @@ from .utils import (
 # BETTING STATE MACHINE
 # =============================================================================
 
+# Integer state codes: compared once per bet, so ints beat string equality
+NORMAL = 0
+CHASING = 1
+ESCALATING = 2
+
+# Fallback generator for callers that do not pass their own (block workers do)
+_DEFAULT_RNG = np.random.default_rng(RANDOM_SEED + 2)
+
+
 class BettingStateMachine:
     """
     Finite state machine for realistic loss-chasing behavior.
@@ -62,16 +74,37 @@ class BettingStateMachine:
         target_escalation: Target escalation ratio from latent factors
         chase_probability: Probability of chasing after loss
         late_night_baseline: Baseline late-night betting %
-        state: Current state ('NORMAL', 'CHASING', 'ESCALATING')
+        state: Current state (NORMAL, CHASING or ESCALATING code)
         consecutive_losses: Count of consecutive losses
         current_late_night_pct: Current late-night betting percentage
     """
 
+    # One instance per player, read on every bet: slots avoid a per-instance
+    # __dict__ and make attribute access a fixed-offset lookup
+    __slots__ = (
+        'base_amount',
+        'target_escalation',
+        'chase_probability',
+        'late_night_baseline',
+        'state',
+        'consecutive_losses',
+        'current_late_night_pct',
+        'rng',
+        'n_bets',
+        'normal_jitter',
+        'chase_jitter',
+        'chase_rolls',
+        'amount_draws',
+        'outcome_draws',
+    )
+
     def __init__(self,
                  base_bet_amount: float,
                  target_escalation_ratio: float,
                  bet_after_loss_ratio: float,
-                 late_night_pct: float):
+                 late_night_pct: float,
+                 rng: Optional[np.random.Generator] = None,
+                 n_bets: int = 0):
         """
         Initialize betting state machine.
 
@@ -80,16 +113,28 @@ class BettingStateMachine:
             target_escalation_ratio: Target escalation (from latent factors)
             bet_after_loss_ratio: Probability of chasing after loss
             late_night_pct: Baseline late-night betting percentage
+            rng: Random generator (default: module-level generator)
+            n_bets: Expected number of bets; their random draws are made
+                up front in bulk instead of one NumPy call per bet
         """
         self.base_amount = base_bet_amount
         self.target_escalation = max(0.9, target_escalation_ratio)  # Min 0.9
         self.chase_probability = np.clip(bet_after_loss_ratio, 0.0, 1.0)
         self.late_night_baseline = np.clip(late_night_pct, 0.0, 0.7)
 
-        self.state = 'NORMAL'
+        self.state = NORMAL
         self.consecutive_losses = 0
         self.current_late_night_pct = late_night_pct
 
+        # Pre-drawn per-bet randomness, indexed by bet number
+        self.rng = rng if rng is not None else _DEFAULT_RNG
+        self.n_bets = n_bets
+        self.normal_jitter = self.rng.uniform(0.8, 1.2, n_bets).tolist()
+        self.chase_jitter = self.rng.uniform(0.9, 1.1, n_bets).tolist()
+        self.chase_rolls = self.rng.random(n_bets).tolist()
+        self.amount_draws = 0
+        self.outcome_draws = 0
+
     def get_next_bet_amount(self) -> float:
         """
         Get bet amount for next bet based on current state.
@@ -97,15 +142,20 @@ class BettingStateMachine:
         Returns:
             Bet amount (dollars)
         """
-        if self.state == 'NORMAL':
+        i = self.amount_draws
+        self.amount_draws += 1
+
+        if self.state == NORMAL:
             # Normal: small variance around base
-            return self.base_amount * np.random.uniform(0.8, 1.2)
+            jitter = self.normal_jitter[i] if i < self.n_bets else self.rng.uniform(0.8, 1.2)
+            return self.base_amount * jitter
 
-        elif self.state == 'CHASING':
+        elif self.state == CHASING:
             # Chasing: escalated by target ratio
-            return self.base_amount * self.target_escalation * np.random.uniform(0.9, 1.1)
+            jitter = self.chase_jitter[i] if i < self.n_bets else self.rng.uniform(0.9, 1.1)
+            return self.base_amount * self.target_escalation * jitter
 
-        elif self.state == 'ESCALATING':
+        elif self.state == ESCALATING:
             # Escalating: exponential growth capped at 5x
             multiplier = min(
                 self.target_escalation ** self.consecutive_losses,
@@ -123,15 +173,19 @@ class BettingStateMachine:
         Args:
             outcome: 'win' or 'loss'
         """
+        i = self.outcome_draws
+        self.outcome_draws += 1
+
         if outcome == 'loss':
             self.consecutive_losses += 1
 
             # Decide if player chases based on their chase_probability
-            if np.random.random() < self.chase_probability:
+            roll = self.chase_rolls[i] if i < self.n_bets else self.rng.random()
+            if roll < self.chase_probability:
                 if self.consecutive_losses == 1:
-                    self.state = 'CHASING'
+                    self.state = CHASING
                 elif self.consecutive_losses >= 2:
-                    self.state = 'ESCALATING'
+                    self.state = ESCALATING
                     # Increase late-night betting when desperate
                     self.current_late_night_pct = min(
                         self.late_night_baseline * (1 + self.consecutive_losses * 0.5),
@@ -139,44 +193,49 @@ class BettingStateMachine:
                     )
             else:
                 # Player doesn't chase this time
-                self.state = 'NORMAL'
+                self.state = NORMAL
                 self.consecutive_losses = 0
 
         else:  # win
             # Win resets state
-            self.state = 'NORMAL'
+            self.state = NORMAL
             self.consecutive_losses = 0
             self.current_late_night_pct = self.late_night_baseline
 
     def is_chasing(self) -> bool:
         """Check if currently in a chasing state."""
-        return self.state in ['CHASING', 'ESCALATING']
+        return self.state != NORMAL
 
 
 # =============================================================================
 # SPORT SELECTION WITH MARKET DRIFT
 # =============================================================================
 
-def select_sport_with_drift(cohort: str,
-                           progress_pct: float) -> str:
-    """
-    Select sport with gradual market drift over time.
+SPORTS = tuple(SPORT_DISTRIBUTION_BASELINE)
 
-    High-risk and critical players shift from major sports (NFL) to niche
-    markets (Table Tennis) as they get more desperate over time.
+# Market tier per sport, indexed like SPORTS (one gather per player sequence)
+SPORT_TIERS = np.array([MARKET_TIERS[sport] for sport in SPORTS])
+
+# Late-window exploration (uniform pick over all sports) for high/critical
+# cohorts once progress passes EXPLORATION_START_PCT
+EXPLORATION_START_PCT = 0.7
+EXPLORATION_PROBS = {'high_risk': 0.20, 'critical': 0.35}
+
+# Drift is evaluated at the midpoint of each of these progress buckets and
+# cached as cumulative distributions (see SPORT_CDF_TABLE)
+SPORT_DRIFT_BUCKETS = 20
+
+
+def _drift_distribution(cohort: str, progress_pct: float) -> Dict[str, float]:
+    """
+    Sport distribution after market drift for a cohort at a point in time.
 
     Args:
         cohort: Player risk cohort
         progress_pct: Progress through betting window (0.0 = start, 1.0 = end)
 
     Returns:
-        Sport category
-
-    Example:
-        >>> # Early in window, high-risk player bets NFL
-        >>> sport = select_sport_with_drift('high_risk', 0.1)
-        >>> # Later, shifts toward niche
-        >>> sport = select_sport_with_drift('high_risk', 0.9)
+        Dict of sport -> probability (sums to 1.0)
     """
     # Start with baseline distribution
     dist = SPORT_DISTRIBUTION_BASELINE.copy()
@@ -194,12 +253,6 @@ def select_sport_with_drift(cohort: str,
     else:
         niche_boost = 0.0
 
-    # Late-window exploration increases sport diversity for high/critical cohorts
-    if cohort in ['high_risk', 'critical'] and progress_pct > 0.7:
-        exploration_prob = 0.20 if cohort == 'high_risk' else 0.35
-        if np.random.random() < exploration_prob:
-            return np.random.choice(list(dist.keys()))
-
     if niche_boost > 0:
         # Shift probability mass from major sports to niche/low-tier markets
         dist['TABLE_TENNIS'] += niche_boost * 0.50
@@ -216,20 +269,105 @@ def select_sport_with_drift(cohort: str,
         total = sum(dist.values())
         dist = {k: v / total for k, v in dist.items()}
 
-    # Sample from distribution
-    sports = list(dist.keys())
-    probs = list(dist.values())
-    return np.random.choice(sports, p=probs)
+    return dist
+
+
+def _sport_cdf(cohort: str, progress_pct: float) -> np.ndarray:
+    """Cumulative sport distribution (ordered as SPORTS), last entry 1.0."""
+    dist = _drift_distribution(cohort, progress_pct)
+    cdf = np.cumsum([dist[sport] for sport in SPORTS])
+    return cdf / cdf[-1]
+
+
+# Cohort -> (SPORT_DRIFT_BUCKETS x len(SPORTS)) array of cumulative
+# distributions, so sampling is a uniform draw plus a search instead of
+# re-running the drift math and np.random.choice on every bet
+SPORT_CDF_TABLE: Dict[str, np.ndarray] = {
+    cohort: np.array([
+        _sport_cdf(cohort, (bucket + 0.5) / SPORT_DRIFT_BUCKETS)
+        for bucket in range(SPORT_DRIFT_BUCKETS)
+    ])
+    for cohort in BEHAVIOR_RANGES
+}
+
+
+def _drift_bucket(progress_pct):
+    """Map progress (scalar or array) to its SPORT_CDF_TABLE row."""
+    return np.minimum((np.asarray(progress_pct) * SPORT_DRIFT_BUCKETS).astype(int),
+                      SPORT_DRIFT_BUCKETS - 1)
+
+
+def select_sport_with_drift(cohort: str,
+                           progress_pct: float,
+                           rng: Optional[np.random.Generator] = None) -> str:
+    """
+    Select sport with gradual market drift over time.
+
+    High-risk and critical players shift from major sports (NFL) to niche
+    markets (Table Tennis) as they get more desperate over time.
+
+    Args:
+        cohort: Player risk cohort
+        progress_pct: Progress through betting window (0.0 = start, 1.0 = end)
+        rng: Random generator (default: module-level generator)
+
+    Returns:
+        Sport category
+
+    Example:
+        >>> # Early in window, high-risk player bets NFL
+        >>> sport = select_sport_with_drift('high_risk', 0.1)
+        >>> # Later, shifts toward niche
+        >>> sport = select_sport_with_drift('high_risk', 0.9)
+    """
+    rng = rng if rng is not None else _DEFAULT_RNG
+
+    # Late-window exploration increases sport diversity for high/critical cohorts
+    if cohort in EXPLORATION_PROBS and progress_pct > EXPLORATION_START_PCT:
+        if rng.random() < EXPLORATION_PROBS[cohort]:
+            return SPORTS[int(rng.integers(len(SPORTS)))]
+
+    # Sample from the cached distribution for this point in the window
+    if cohort in SPORT_CDF_TABLE:
+        cdf = SPORT_CDF_TABLE[cohort][int(_drift_bucket(progress_pct))]
+    else:
+        cdf = _sport_cdf(cohort, progress_pct)
+    index = int(np.searchsorted(cdf, rng.random(), side='right'))
+    return SPORTS[min(index, len(SPORTS) - 1)]
+
+
+def _draw_sport_indices(cohort: str,
+                        progress_pct: np.ndarray,
+                        rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Vectorized select_sport_with_drift returning positions in SPORTS, one per bet."""
+    rng = rng if rng is not None else _DEFAULT_RNG
+    n_bets = len(progress_pct)
+
+    cdf_rows = SPORT_CDF_TABLE[cohort][_drift_bucket(progress_pct)]
+    rolls = rng.random(n_bets)
+    indices = np.minimum((cdf_rows <= rolls[:, None]).sum(axis=1), len(SPORTS) - 1)
+
+    if cohort in EXPLORATION_PROBS:
+        explore = ((progress_pct > EXPLORATION_START_PCT)
+                   & (rng.random(n_bets) < EXPLORATION_PROBS[cohort]))
+        indices = np.where(explore, rng.integers(len(SPORTS), size=n_bets), indices)
+
+    return indices
 
 
 # =============================================================================
 # TEMPORAL PATTERN GENERATION
 # =============================================================================
 
+# Mean days between bets (exponential gaps; faster betting when chasing)
+NORMAL_GAP_DAYS = 1.0
+CHASING_GAP_DAYS = 0.3
+
 def generate_bet_timestamp(current_date: datetime,
                           end_date: datetime,
                           late_night_pct: float,
-                          is_chasing: bool) -> datetime:
+                          is_chasing: bool,
+                          rng: Optional[np.random.Generator] = None) -> datetime:
     """
     Generate realistic bet timestamp with temporal patterns.
 
@@ -241,6 +379,7 @@ def generate_bet_timestamp(current_date: datetime,
         end_date: End of betting window
         late_night_pct: Percentage of bets that are late-night
         is_chasing: Whether player is currently chasing
+        rng: Random generator (default: module-level generator)
 
     Returns:
         Bet timestamp
@@ -252,149 +391,391 @@ def generate_bet_timestamp(current_date: datetime,
         >>> isinstance(ts, datetime)
         True
     """
+    rng = rng if rng is not None else _DEFAULT_RNG
+
     # Random day increment (faster when chasing)
     if is_chasing:
-        days_increment = np.random.exponential(scale=0.3)  # Faster betting
+        days_increment = rng.exponential(scale=CHASING_GAP_DAYS)  # Faster betting
     else:
-        days_increment = np.random.exponential(scale=1.0)  # Normal pace
-
-    new_date = current_date + timedelta(days=days_increment)
-
-    # Don't exceed end date
-    if new_date > end_date:
-        new_date = end_date
+        days_increment = rng.exponential(scale=NORMAL_GAP_DAYS)  # Normal pace
 
     # Select hour based on late-night percentage
-    if np.random.random() < late_night_pct:
+    if rng.random() < late_night_pct:
         # Late night (2 AM - 6 AM)
-        hour = np.random.randint(LATE_NIGHT_START_HOUR, LATE_NIGHT_END_HOUR)
+        hour = int(rng.integers(LATE_NIGHT_START_HOUR, LATE_NIGHT_END_HOUR))
     else:
         # Primetime (peak at 8 PM, normal distribution)
-        hour = int(np.random.normal(PRIMETIME_MEAN_HOUR, PRIMETIME_STD_HOURS))
+        hour = int(rng.normal(PRIMETIME_MEAN_HOUR, PRIMETIME_STD_HOURS))
         hour = max(6, min(23, hour))  # Clip to 6 AM - 11 PM
 
-    minute = np.random.randint(0, 60)
-    second = np.random.randint(0, 60)
+    minute = int(rng.integers(0, 60))
+    second = int(rng.integers(0, 60))
+
+    return place_bet_timestamp(current_date, end_date, days_increment, hour, minute, second)
+
+
+def place_bet_timestamp(current_date: datetime,
+                        end_date: datetime,
+                        days_increment: float,
+                        hour: int,
+                        minute: int,
+                        second: int) -> datetime:
+    """
+    Build a bet timestamp from already-drawn gap and time-of-day values.
+
+    Deterministic half of generate_bet_timestamp, so callers that draw the
+    randomness for many bets up front can reuse the same calendar logic.
+
+    Args:
+        current_date: Timestamp of the previous bet
+        end_date: End of betting window
+        days_increment: Days to advance from current_date
+        hour: Hour of day for the bet
+        minute: Minute of the hour
+        second: Second of the minute
+
+    Returns:
+        Bet timestamp (never before current_date, never after end_date)
+    """
+    timestamp_us = _place_bet_micros(
+        _to_micros(current_date), _to_micros(end_date), days_increment, hour, minute, second
+    )
+    return _EPOCH + timedelta(microseconds=timestamp_us)
+
+
+# Timestamps inside the bet loop are integer microseconds since the epoch, so
+# each bet is int arithmetic rather than datetime allocation and .replace()
+_EPOCH = datetime(1970, 1, 1)
+_MICROS_PER_SECOND = 1_000_000
+_MICROS_PER_DAY = 86_400 * _MICROS_PER_SECOND
+
+
+def _to_micros(dt: datetime) -> int:
+    """Naive datetime -> microseconds since the epoch."""
+    return (dt - _EPOCH) // timedelta(microseconds=1)
 
-    timestamp = new_date.replace(hour=hour, minute=minute, second=second)
+
+def _place_bet_micros(current_us: int,
+                      end_us: int,
+                      days_increment: float,
+                      hour: int,
+                      minute: int,
+                      second: int) -> int:
+    """place_bet_timestamp on epoch microseconds (same rounding as timedelta)."""
+    new_us = current_us + round(days_increment * _MICROS_PER_DAY)
+
+    # Don't exceed end date
+    if new_us > end_us:
+        new_us = end_us
+
+    # Replace the time of day, keeping sub-second precision
+    timestamp_us = (new_us - new_us % _MICROS_PER_DAY
+                    + (hour * 3600 + minute * 60 + second) * _MICROS_PER_SECOND
+                    + new_us % _MICROS_PER_SECOND)
     # Enforce monotonic timestamps while preserving time-of-day distribution
-    if timestamp < current_date:
-        timestamp = timestamp + timedelta(days=1)
-        if timestamp > end_date:
-            timestamp = end_date
-    return timestamp
+    if timestamp_us < current_us:
+        timestamp_us += _MICROS_PER_DAY
+        if timestamp_us > end_us:
+            timestamp_us = end_us
+    return timestamp_us
+
+
+# Betting window bounds (end is the last second of END_DATE)
+_WINDOW_START_US = _to_micros(datetime.strptime(START_DATE, '%Y-%m-%d'))
+_WINDOW_END_US = _to_micros(
+    datetime.strptime(END_DATE, '%Y-%m-%d') + timedelta(days=1) - timedelta(seconds=1)
+)
 
 
 # =============================================================================
 # BET GENERATION FOR SINGLE PLAYER
 # =============================================================================
 
+def format_bet_timestamps(timestamps: np.ndarray) -> List[str]:
+    """
+    Format datetime64 bet timestamps as ISO 8601 strings in one call.
+
+    Same output as format_timestamp applied per bet.
+
+    Args:
+        timestamps: Array of datetime64 values
+
+    Returns:
+        List of 'YYYY-MM-DDTHH:MM:SS' strings
+    """
+    return np.datetime_as_string(np.asarray(timestamps, dtype='datetime64[s]'), unit='s').tolist()
+
+
+# Output columns of the bet generator, accumulated column-wise (one list per
+# column) instead of one dict per bet
+BET_COLUMNS = (
+    'bet_id',
+    'player_id',
+    'bet_timestamp',
+    'sport_category',
+    'market_type',
+    'bet_amount',
+    'odds_american',
+    'outcome',
+    'market_tier',
+)
+
+# Columns carried as numpy arrays inside the generator (int64 timestamps and
+# uint8 sport codes) and only turned into labels/strings at the edges
+ARRAY_COLUMNS = ('bet_timestamp', 'sport_category')
+
+
+# Per-player behavior parameters, uniform over the cohort's BEHAVIOR_RANGES
+BEHAVIOR_DRAWS = (
+    'bets_per_week',
+    'base_bet_amount',
+    'bet_after_loss_ratio',
+    'late_night_pct',
+)
+
+
+def draw_player_behaviors(cohorts: List[str],
+                          rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """
+    Draw BEHAVIOR_DRAWS parameters for many players at once.
+
+    One vectorized uniform draw per parameter (bounds vary by cohort)
+    instead of one sample_from_range call per parameter per player.
+
+    Args:
+        cohorts: Risk cohort of each player
+        rng: Random generator (default: module-level generator)
+
+    Returns:
+        Dict of parameter name -> array of values, one per player
+
+    Example:
+        >>> draws = draw_player_behaviors(['low_risk', 'critical'])
+        >>> len(draws['bets_per_week'])
+        2
+    """
+    rng = rng if rng is not None else _DEFAULT_RNG
+    draws = {}
+    for key in BEHAVIOR_DRAWS:
+        bounds = np.array([BEHAVIOR_RANGES[cohort][key] for cohort in cohorts],
+                          dtype=float).reshape(-1, 2)
+        draws[key] = rng.uniform(bounds[:, 0], bounds[:, 1])
+    return draws
+
+
+def _behavior_value(player, behavior: Dict, key: str) -> float:
+    """Pre-drawn behavior parameter from the player record, else sample it."""
+    value = player.get(key)
+    return sample_from_range(behavior[key]) if value is None else value
+
+
 def generate_bets_for_single_player(player: pd.Series,
-                                   bet_id_start: int) -> List[Dict]:
+                                   bet_id_start: int,
+                                   rng: Optional[np.random.Generator] = None) -> Dict[str, List]:
     """
     Generate betting sequence for a single player.
 
     Uses state machine to simulate realistic loss-chasing patterns.
 
     Args:
-        player: Player row from players DataFrame
+        player: Player row (Series or record dict) from players DataFrame;
+            may carry pre-drawn BEHAVIOR_DRAWS values, otherwise they are
+            sampled here
         bet_id_start: Starting bet ID number
+        rng: Random generator (default: module-level generator)
 
     Returns:
-        List of bet dictionaries
+        Dict of column name -> list of values (see BET_COLUMNS)
 
     Example:
         >>> # Assume player is a Series with required fields
         >>> bets = generate_bets_for_single_player(player, 0)
-        >>> len(bets) > 0
+        >>> len(bets['bet_id']) > 0
         True
     """
+    bets = _player_bet_columns(player, bet_id_start, rng)
+    bets['bet_timestamp'] = format_bet_timestamps(bets['bet_timestamp'])
+    bets['sport_category'] = [SPORTS[code] for code in bets['sport_category'].tolist()]
+    return bets
+
+
+def _player_bet_columns(player,
+                        bet_id_start: int,
+                        rng: Optional[np.random.Generator] = None) -> Dict[str, List]:
+    """
+    generate_bets_for_single_player with array-valued ARRAY_COLUMNS:
+    bet_timestamp as datetime64[s] and sport_category as uint8 SPORTS codes.
+    """
+    rng = rng if rng is not None else _DEFAULT_RNG
     cohort = player['risk_cohort']
     behavior = BEHAVIOR_RANGES[cohort]
 
     # Determine number of bets
-    bets_per_week = sample_from_range(behavior['bets_per_week'])
+    bets_per_week = _behavior_value(player, behavior, 'bets_per_week')
     total_bets = int(bets_per_week * WEEKS_IN_WINDOW)
 
     # Initialize state machine
-    base_bet_amount = sample_from_range(behavior['base_bet_amount'])
+    base_bet_amount = _behavior_value(player, behavior, 'base_bet_amount')
     state_machine = BettingStateMachine(
         base_bet_amount=base_bet_amount,
         target_escalation_ratio=player['target_bet_escalation'],
-        bet_after_loss_ratio=sample_from_range(behavior['bet_after_loss_ratio']),
-        late_night_pct=sample_from_range(behavior['late_night_pct'])
+        bet_after_loss_ratio=_behavior_value(player, behavior, 'bet_after_loss_ratio'),
+        late_night_pct=_behavior_value(player, behavior, 'late_night_pct'),
+        rng=rng,
+        n_bets=total_bets
     )
 
-    # Generate bets
-    bets = []
-    current_date = datetime.strptime(START_DATE, '%Y-%m-%d')
-    end = datetime.strptime(END_DATE, '%Y-%m-%d') + timedelta(days=1) - timedelta(seconds=1)
+    # Generate bets (per-bet values only; constant and derived columns are
+    # filled in once the sequence length is known)
+    timestamps, amounts, odds_values, outcomes = [], [], [], []
+    current_us = _WINDOW_START_US
+    end_us = _WINDOW_END_US
+
+    # Outcomes do not depend on betting state, so draw them in one vectorized
+    # call (cohort-specific win rates); only the state machine stays per-bet
+    win_rate = COHORT_WIN_RATES.get(cohort, WIN_RATE_BASELINE)
+    wins = (rng.random(total_bets) < win_rate).tolist()
+
+    # Timestamp randomness for every bet, also drawn in bulk. Betting state
+    # only rescales the day gap and picks late-night vs primetime hours, so
+    # it is applied per bet in the loop
+    day_gaps = rng.standard_exponential(total_bets).tolist()
+    late_rolls = rng.random(total_bets).tolist()
+    late_hours = rng.integers(LATE_NIGHT_START_HOUR, LATE_NIGHT_END_HOUR, total_bets).tolist()
+    primetime_hours = np.clip(
+        rng.normal(PRIMETIME_MEAN_HOUR, PRIMETIME_STD_HOURS, total_bets).astype(int), 6, 23
+    ).tolist()
+    minutes = rng.integers(0, 60, total_bets).tolist()
+    seconds = rng.integers(0, 60, total_bets).tolist()
+
+    # Sport choice depends only on progress through the window (market drift)
+    sport_indices = _draw_sport_indices(cohort, np.arange(total_bets) / max(total_bets, 1), rng)
+    sports = [SPORTS[index] for index in sport_indices.tolist()]
 
     for bet_num in range(total_bets):
-        if current_date >= end:
+        if current_us >= end_us:
             break
-        # Progress through betting window (0.0 to 1.0)
-        progress_pct = bet_num / max(total_bets, 1)
-
-        # Generate timestamp
-        timestamp = generate_bet_timestamp(
-            current_date,
-            end,
-            state_machine.current_late_night_pct,
-            state_machine.is_chasing()
+
+        # Generate timestamp (faster, later-night betting when chasing)
+        gap_scale = CHASING_GAP_DAYS if state_machine.is_chasing() else NORMAL_GAP_DAYS
+        if late_rolls[bet_num] < state_machine.current_late_night_pct:
+            hour = late_hours[bet_num]
+        else:
+            hour = primetime_hours[bet_num]
+        timestamp_us = _place_bet_micros(
+            current_us,
+            end_us,
+            day_gaps[bet_num] * gap_scale,
+            hour,
+            minutes[bet_num],
+            seconds[bet_num]
         )
 
         # Select sport (with market drift)
-        sport = select_sport_with_drift(cohort, progress_pct)
+        sport = sports[bet_num]
 
         # Get bet amount from state machine
+        # (minimum $0.01 and cent rounding applied to the column below)
         bet_amount = state_machine.get_next_bet_amount()
-        bet_amount = round_to_cents(max(0.01, bet_amount))  # Minimum $0.01
 
         # Generate realistic odds
         odds = generate_realistic_odds(sport)
 
-        # Simulate outcome (cohort-specific win rates)
-        win_rate = COHORT_WIN_RATES.get(cohort, WIN_RATE_BASELINE)
-        outcome = 'win' if np.random.random() < win_rate else 'loss'
+        outcome = 'win' if wins[bet_num] else 'loss'
 
         # Update state machine
         state_machine.process_outcome(outcome)
 
-        # Create bet record
-        bet = {
-            'bet_id': generate_bet_id(bet_id_start + bet_num),
-            'player_id': player['player_id'],
-            'bet_timestamp': format_timestamp(timestamp),
-            'sport_category': sport,
-            'market_type': 'moneyline',  # Simplified
-            'bet_amount': bet_amount,
-            'odds_american': odds,
-            'outcome': outcome,
-            'market_tier': MARKET_TIERS[sport]
-        }
-
-        bets.append(bet)
+        # Append bet record
+        timestamps.append(timestamp_us)
+        amounts.append(bet_amount)
+        odds_values.append(odds)
+        outcomes.append(outcome)
 
         # Advance current date
-        current_date = timestamp
-
-    return bets
+        current_us = timestamp_us
+
+    n_bets = len(timestamps)
+    sport_indices = sport_indices[:n_bets]
+    return {
+        'bet_id': [generate_bet_id(bet_id_start + bet_num) for bet_num in range(n_bets)],
+        'player_id': [player['player_id']] * n_bets,
+        'bet_timestamp': np.array(timestamps, dtype=np.int64).astype('datetime64[us]')
+                           .astype('datetime64[s]'),
+        'sport_category': sport_indices.astype(np.uint8),
+        'market_type': ['moneyline'] * n_bets,  # Simplified
+        'bet_amount': np.round(np.maximum(amounts, 0.01), 2).tolist(),
+        'odds_american': odds_values,
+        'outcome': outcomes,
+        'market_tier': SPORT_TIERS[sport_indices].tolist(),
+    }
 
 
 # =============================================================================
 # BET GENERATION FOR ALL PLAYERS
 # =============================================================================
 
-def generate_bets_for_all_players(players_df: pd.DataFrame) -> pd.DataFrame:
+# Players per work unit. Each block is seeded from its index, so output does
+# not depend on how many worker processes run the blocks.
+PLAYER_BLOCK_SIZE = 500
+
+
+def _generate_bets_for_block(block_index: int, players: List[Dict]) -> Dict[str, List]:
+    """
+    Generate bets for one block of players with block-derived seeds.
+
+    Args:
+        block_index: Position of the block within the full player list
+        players: Player records (risk_cohort, target_bet_escalation, player_id)
+
+    Returns:
+        Dict of column name -> list of values (bet_id assigned by the caller;
+        ARRAY_COLUMNS as numpy arrays)
+    """
+    seed_seq = np.random.SeedSequence([RANDOM_SEED + 2, block_index])
+    rng = np.random.default_rng(seed_seq)
+    random.seed(int(seed_seq.generate_state(1)[0]))  # odds
+
+    behaviors = {
+        key: values.tolist()  # Python floats keep per-bet arithmetic off numpy scalars
+        for key, values in draw_player_behaviors(
+            [player['risk_cohort'] for player in players], rng
+        ).items()
+    }
+
+    bets = {column: [] for column in BET_COLUMNS}
+    for index, player in enumerate(players):
+        player = dict(player, **{key: behaviors[key][index] for key in BEHAVIOR_DRAWS})
+        player_bets = _player_bet_columns(player, 0, rng)
+        for column, values in player_bets.items():
+            if column in ARRAY_COLUMNS:
+                bets[column].append(values)
+            else:
+                bets[column].extend(values)
+    return _concatenate_array_columns(bets)
+
+
+def _concatenate_array_columns(bets: Dict[str, List]) -> Dict[str, List]:
+    """Join the per-player (or per-block) chunks of each ARRAY_COLUMNS column."""
+    bets['bet_timestamp'] = np.concatenate(
+        bets['bet_timestamp'] or [np.empty(0, dtype='datetime64[s]')])
+    bets['sport_category'] = np.concatenate(
+        bets['sport_category'] or [np.empty(0, dtype=np.uint8)])
+    return bets
+
+
+def generate_bets_for_all_players(players_df: pd.DataFrame,
+                                  n_jobs: Optional[int] = None) -> pd.DataFrame:
     """
     Generate betting sequences for all players.
 
     This is the main entry point for bet generation. Generates ~500,000 bets
-    across 10,000 players with realistic patterns.
+    across 10,000 players with realistic patterns. Players are independent,
+    so blocks of players are generated in parallel worker processes.
 
     Args:
         players_df: Players DataFrame with latent factors
+        n_jobs: Worker processes (default: CPU count; 1 runs in-process)
 
     Returns:
         DataFrame with all bets:
@@ -418,33 +799,59 @@ def generate_bets_for_all_players(players_df: pd.DataFrame) -> pd.DataFrame:
     print(f"Generating bets for {len(players_df)} players...")
     print(f"  (This may take 2-3 minutes for full 10K player dataset)")
 
-    # Set random seed
-    np.random.seed(RANDOM_SEED + 2)  # Offset from other generators
-
-    all_bets = []
-    bet_counter = 0
-
-    # Generate bets for each player
-    for idx, player in players_df.iterrows():
-        player_bets = generate_bets_for_single_player(player, bet_counter)
-        all_bets.extend(player_bets)
-        bet_counter += len(player_bets)
-
-        # Progress indicator every 1000 players
-        if (idx + 1) % 1000 == 0:
-            print(f"  Processed {idx + 1}/{len(players_df)} players "
-                  f"({len(all_bets)} bets so far)...")
-
+    records = players_df[['player_id', 'risk_cohort', 'target_bet_escalation']].to_dict('records')
+    blocks = [
+        records[start:start + PLAYER_BLOCK_SIZE]
+        for start in range(0, len(records), PLAYER_BLOCK_SIZE)
+    ]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, max(len(blocks), 1))
+
+    all_bets = {column: [] for column in BET_COLUMNS}
+    processed = 0
+
+    executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        block_map = executor.map if executor else map
+        for block, block_bets in zip(blocks, block_map(_generate_bets_for_block,
+                                                       range(len(blocks)), blocks)):
+            for column, values in block_bets.items():
+                if column in ARRAY_COLUMNS:
+                    all_bets[column].append(values)
+                else:
+                    all_bets[column].extend(values)
+            processed += len(block)
+            print(f"  Processed {processed}/{len(players_df)} players "
+                  f"({len(all_bets['bet_id'])} bets so far)...")
+    finally:
+        if executor:
+            executor.shutdown()
+
+    # Bet IDs are sequential in player order, as in a single-process run
+    all_bets['bet_id'] = [generate_bet_id(index) for index in range(len(all_bets['bet_id']))]
+
+    # Sports travel as uint8 codes end-to-end and only become labels here;
+    # timestamps stay datetime64[s] until export
+    all_bets = _concatenate_array_columns(all_bets)
+    all_bets['sport_category'] = pd.Categorical.from_codes(
+        all_bets['sport_category'], categories=SPORTS
+    )
     bets_df = pd.DataFrame(all_bets)
 
+    # Low-cardinality labels as categoricals: int codes instead of 500K
+    # Python strings, so value_counts/comparisons work on the codes
+    bets_df['market_type'] = bets_df['market_type'].astype('category')
+    bets_df['outcome'] = pd.Categorical(bets_df['outcome'], categories=['win', 'loss'])
+
     print(f"✓ Generated {len(bets_df)} total bets")
 
-    # Print bet distribution by cohort
-    merged = players_df.merge(bets_df, on='player_id')
-    cohort_bet_counts = merged.groupby('risk_cohort').size()
+    # Print bet distribution by cohort (map player -> cohort; no join of the
+    # full bets table)
+    player_cohorts = players_df.set_index('player_id')['risk_cohort']
+    cohort_bet_counts = bets_df['player_id'].map(player_cohorts).value_counts().sort_index()
+    cohort_player_counts = players_df['risk_cohort'].value_counts()
     print(f"\n  Bets by cohort:")
     for cohort, count in cohort_bet_counts.items():
-        avg_per_player = count / len(players_df[players_df['risk_cohort'] == cohort])
+        avg_per_player = count / cohort_player_counts[cohort]
         print(f"    {cohort}: {count} bets ({avg_per_player:.1f} avg per player)")
 
     return bets_df
@@ -452,11 +859,11 @@ def generate_bets_for_all_players(players_df: pd.DataFrame) -> pd.DataFrame:
 
 def export_bets_csv(bets_df: pd.DataFrame, output_path: str):
     """
-    Export bets to CSV.
+    Export bets to CSV or Parquet.
 
     Args:
         bets_df: Bets DataFrame
-        output_path: Path for output CSV
+        output_path: Path for output file (.csv or .parquet)
 
     Returns:
         None (writes file)
@@ -473,7 +880,16 @@ def export_bets_csv(bets_df: pd.DataFrame, output_path: str):
         'outcome'
     ]
 
-    bets_df[export_columns].to_csv(output_path, index=False)
+    export_df = bets_df[export_columns]
+    if (not str(output_path).endswith('.parquet')
+            and pd.api.types.is_datetime64_any_dtype(export_df['bet_timestamp'])):
+        # ISO 8601 text, formatted in one call at export time
+        export_df = export_df.assign(
+            bet_timestamp=format_bet_timestamps(export_df['bet_timestamp'].to_numpy())
+        )
+
+    write_table(export_df, output_path,
+                parquet_types={'bet_timestamp': 'TIMESTAMP'})
     print(f"✓ Exported bets to {output_path}")
 
 
@@ -571,11 +987,11 @@ if __name__ == "__main__":
     test_bets = generate_bets_for_single_player(test_player, 0)
 
     # Find sequences of losses followed by increased bets
-    bet_amounts = [b['bet_amount'] for b in test_bets[:20]]
-    outcomes = [b['outcome'] for b in test_bets[:20]]
+    bet_amounts = test_bets['bet_amount'][:20]
+    outcomes = test_bets['outcome'][:20]
 
     print(f"  First 20 bets for {test_player['player_id']}:")
-    for i in range(min(10, len(test_bets))):
+    for i in range(min(10, len(test_bets['bet_id']))):
         print(f"    Bet {i+1}: ${bet_amounts[i]:.2f} → {outcomes[i]}")
 
     print("=" * 60)
@@ -16,15 +16,24 @@ Mathematical Foundation:
 """
 
 import numpy as np
-from numpy.linalg import cholesky
-from typing import Tuple
-from .config import CORRELATION_MATRIX, LATENT_FACTOR_MEANS, LATENT_FACTOR_STDS
+from typing import Optional, Tuple
+from .config import CORRELATION_MATRIX, LATENT_FACTOR_MEANS, LATENT_FACTOR_STDS, RANDOM_SEED
+
+# Generator used when callers do not pass their own
+_DEFAULT_RNG = np.random.default_rng(RANDOM_SEED)
+
+# Latent factor covariance and its Cholesky factor. CORRELATION_MATRIX and
+# LATENT_FACTOR_STDS are constants (only the means vary per cohort), so the
+# factorisation is done once at import.
+_LATENT_COV = LATENT_FACTOR_STDS[:, None] * CORRELATION_MATRIX * LATENT_FACTOR_STDS[None, :]
+_LATENT_CHOLESKY = np.linalg.cholesky(_LATENT_COV)
 
 
 def generate_correlated_variables(n_samples: int,
                                   correlation_matrix: np.ndarray,
                                   means: np.ndarray,
-                                  stds: np.ndarray) -> np.ndarray:
+                                  stds: np.ndarray,
+                                  rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate multivariate normal distribution with specified correlations.
 
@@ -38,11 +47,14 @@ def generate_correlated_variables(n_samples: int,
     3. Generate uncorrelated standard normal: Z ~ N(0, I)
     4. Transform: X = L @ Z + μ
 
+    Steps 2-4 run inside Generator.multivariate_normal(method='cholesky').
+
     Args:
         n_samples: Number of samples to generate (e.g., 10,000 players)
         correlation_matrix: Target correlation matrix (k x k)
         means: Mean values for each variable (length k)
         stds: Standard deviations for each variable (length k)
+        rng: numpy Generator to draw from (default: module-level generator)
 
     Returns:
         Array of shape (n_samples, k) with target correlations
@@ -70,15 +82,19 @@ def generate_correlated_variables(n_samples: int,
     if correlation_matrix.shape[0] != len(stds):
         raise ValueError("Correlation matrix dimensions must match stds length")
 
+    rng = _DEFAULT_RNG if rng is None else rng
+
     # Step 1: Convert correlation matrix to covariance matrix
-    # Cov(X, Y) = ρ(X, Y) × σ_X × σ_Y
-    D = np.diag(stds)  # Diagonal matrix of standard deviations
-    cov_matrix = D @ correlation_matrix @ D
+    # Cov(X, Y) = ρ(X, Y) × σ_X × σ_Y (D @ R @ D as elementwise scaling)
+    stds = np.asarray(stds, dtype=float)
+    cov_matrix = stds[:, None] * correlation_matrix * stds[None, :]
 
-    # Step 2: Cholesky decomposition
-    # Σ = L @ L.T where L is lower triangular
+    # Steps 2-4: Cholesky decomposition Σ = L @ L.T, draw Z ~ N(0, I) and
+    # transform X = Z @ L.T + μ
     try:
-        L = cholesky(cov_matrix)
+        return rng.multivariate_normal(
+            means, cov_matrix, size=n_samples, method='cholesky', check_valid='ignore'
+        )
     except np.linalg.LinAlgError:
         raise ValueError(
             "Correlation matrix is not positive definite. "
@@ -86,19 +102,10 @@ def generate_correlated_variables(n_samples: int,
             "and matrix is feasible."
         )
 
-    # Step 3: Generate uncorrelated standard normal samples
-    # Z ~ N(0, I) where I is identity matrix
-    uncorrelated = np.random.standard_normal((n_samples, len(means)))
-
-    # Step 4: Transform to correlated samples
-    # X = L @ Z.T + μ, then transpose back
-    correlated = uncorrelated @ L.T + means
-
-    return correlated
-
 
 def generate_latent_factors_for_cohort(n_samples: int,
-                                       cohort: str) -> np.ndarray:
+                                       cohort: str,
+                                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate latent factors for a specific risk cohort.
 
@@ -114,6 +121,7 @@ def generate_latent_factors_for_cohort(n_samples: int,
     Args:
         n_samples: Number of players in this cohort
         cohort: Risk cohort ('low_risk', 'medium_risk', 'high_risk', 'critical')
+        rng: numpy Generator to draw from (default: module-level generator)
 
     Returns:
         Array of shape (n_samples, 4) with latent factors
@@ -129,15 +137,20 @@ def generate_latent_factors_for_cohort(n_samples: int,
     if cohort not in LATENT_FACTOR_MEANS:
         raise ValueError(f"Invalid cohort: {cohort}")
 
-    means = LATENT_FACTOR_MEANS[cohort]
-    stds = LATENT_FACTOR_STDS
+    return _sample_latent_factors(n_samples, LATENT_FACTOR_MEANS[cohort], rng)
+
 
-    return generate_correlated_variables(
-        n_samples=n_samples,
-        correlation_matrix=CORRELATION_MATRIX,
-        means=means,
-        stds=stds
-    )
+def _sample_latent_factors(n_samples: int,
+                           means: np.ndarray,
+                           rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    generate_correlated_variables for the latent factor covariance, reusing
+    the Cholesky factor computed at import (same draws as multivariate_normal).
+    """
+    rng = _DEFAULT_RNG if rng is None else rng
+    samples = rng.standard_normal((n_samples, len(means))) @ _LATENT_CHOLESKY.T
+    samples += means
+    return samples
 
 
 def verify_correlation(data: np.ndarray,
@@ -165,23 +178,18 @@ def verify_correlation(data: np.ndarray,
     # Calculate actual correlation matrix
     actual_corr = np.corrcoef(data, rowvar=False)
 
-    # Compare each correlation
-    n_vars = expected_corr_matrix.shape[0]
-    all_pass = True
-
-    for i in range(n_vars):
-        for j in range(i + 1, n_vars):  # Upper triangle only
-            expected = expected_corr_matrix[i, j]
-            actual = actual_corr[i, j]
-            diff = abs(actual - expected)
+    # Compare all correlations at once (upper triangle only)
+    upper = np.triu(np.ones_like(expected_corr_matrix, dtype=bool), k=1)
+    diffs = np.abs(actual_corr - expected_corr_matrix)
+    fails = upper & (diffs > tolerance)
 
-            if diff > tolerance:
-                all_pass = False
-                print(f"⚠ Correlation [{i}, {j}]: "
-                      f"Expected {expected:.3f}, got {actual:.3f} "
-                      f"(diff: {diff:.3f})")
+    # Report only the failing pairs
+    for i, j in np.argwhere(fails):
+        print(f"⚠ Correlation [{i}, {j}]: "
+              f"Expected {expected_corr_matrix[i, j]:.3f}, got {actual_corr[i, j]:.3f} "
+              f"(diff: {diffs[i, j]:.3f})")
 
-    return all_pass, actual_corr
+    return not fails.any(), actual_corr
 
 
 def calculate_correlation_with_derived_metric(gamalyze_scores: np.ndarray,
@@ -208,7 +216,9 @@ def calculate_correlation_with_derived_metric(gamalyze_scores: np.ndarray,
     return np.corrcoef(gamalyze_scores, bet_metrics)[0, 1]
 
 
-def add_noise(values: np.ndarray, noise_std: float = 0.05) -> np.ndarray:
+def add_noise(values: np.ndarray,
+              noise_std: float = 0.05,
+              rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Add Gaussian noise to values to simulate measurement variability.
 
@@ -218,6 +228,7 @@ def add_noise(values: np.ndarray, noise_std: float = 0.05) -> np.ndarray:
     Args:
         values: Array of values
         noise_std: Standard deviation of noise (relative to value scale)
+        rng: numpy Generator to draw from (default: module-level generator)
 
     Returns:
         Noisy values
@@ -228,7 +239,8 @@ def add_noise(values: np.ndarray, noise_std: float = 0.05) -> np.ndarray:
         >>> np.allclose(values, noisy, atol=5)  # Within 5 units
         True
     """
-    noise = np.random.normal(0, noise_std, size=values.shape)
+    rng = _DEFAULT_RNG if rng is None else rng
+    noise = rng.normal(0.0, noise_std, size=values.shape)
     return values + noise
 
 
@@ -20,7 +20,7 @@ These scores correlate with betting patterns:
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 from .config import (
     GAMALYZE_MIN,
     GAMALYZE_MAX,
@@ -30,20 +30,28 @@ from .config import (
     START_DATE,
     RANDOM_SEED
 )
-from .correlations import add_noise
 from .utils import (
-    clip_to_valid_range,
     normalize_to_0_100,
-    random_date_past_n_days,
-    format_date,
-    generate_assessment_id
+    random_dates_past_n_days,
+    format_dates,
+    generate_assessment_ids,
+    write_table
 )
 
+# Score columns (0-100, rounded to 2 decimals)
+SCORE_COLUMNS = ['sensitivity_to_loss', 'sensitivity_to_reward',
+                 'risk_tolerance', 'decision_consistency']
+
+# Generator used when callers do not pass their own (offset to avoid the
+# same stream as players)
+_DEFAULT_RNG = np.random.default_rng(RANDOM_SEED + 1)
+
 
 def transform_latent_to_gamalyze(latent_sensitivity: np.ndarray,
                                  latent_risk_tolerance: np.ndarray,
                                  latent_consistency: np.ndarray,
-                                 noise_std: float = GAMALYZE_NOISE_STD) -> Dict[str, np.ndarray]:
+                                 noise_std: float = GAMALYZE_NOISE_STD,
+                                 rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
     """
     Transform player latent factors to Gamalyze scores.
 
@@ -55,6 +63,7 @@ def transform_latent_to_gamalyze(latent_sensitivity: np.ndarray,
         latent_risk_tolerance: Raw risk tolerance values
         latent_consistency: Raw decision consistency values
         noise_std: Standard deviation of noise to add
+        rng: numpy Generator to draw from (default: module-level generator)
 
     Returns:
         Dict with Gamalyze score arrays:
@@ -71,28 +80,25 @@ def transform_latent_to_gamalyze(latent_sensitivity: np.ndarray,
         >>> 0 <= scores['sensitivity_to_loss'].min() <= 100
         True
     """
+    rng = _DEFAULT_RNG if rng is None else rng
     n = len(latent_sensitivity)
 
     # Transform latent factors to Gamalyze scores with noise
     # Use latent values as primary signal (95% correlation)
     # Add small noise for realism (5% variance)
-
-    sensitivity_to_loss = add_noise(latent_sensitivity, noise_std)
-    sensitivity_to_loss = clip_to_valid_range(sensitivity_to_loss, GAMALYZE_MIN, GAMALYZE_MAX)
-
-    risk_tolerance = add_noise(latent_risk_tolerance, noise_std)
-    risk_tolerance = clip_to_valid_range(risk_tolerance, GAMALYZE_MIN, GAMALYZE_MAX)
-
-    decision_consistency = add_noise(latent_consistency, noise_std)
-    decision_consistency = clip_to_valid_range(decision_consistency, GAMALYZE_MIN, GAMALYZE_MAX)
+    # Noise and clipping run in place over one (3, n) block (same draws as
+    # add_noise + clip_to_valid_range per factor)
+    scores = np.stack([latent_sensitivity, latent_risk_tolerance, latent_consistency]).astype(float)
+    scores += rng.normal(0.0, noise_std, size=scores.shape)
+    np.clip(scores, GAMALYZE_MIN, GAMALYZE_MAX, out=scores)
+    sensitivity_to_loss, risk_tolerance, decision_consistency = scores
 
     # Sensitivity to reward has moderate correlation with risk tolerance (0.6)
     # Plus some independent variance (0.4)
-    sensitivity_to_reward = (
-        0.6 * risk_tolerance +
-        0.4 * np.random.uniform(GAMALYZE_MIN, GAMALYZE_MAX, size=n)
-    )
-    sensitivity_to_reward = clip_to_valid_range(sensitivity_to_reward, GAMALYZE_MIN, GAMALYZE_MAX)
+    sensitivity_to_reward = rng.uniform(GAMALYZE_MIN, GAMALYZE_MAX, size=n)
+    sensitivity_to_reward *= 0.4
+    sensitivity_to_reward += 0.6 * risk_tolerance
+    np.clip(sensitivity_to_reward, GAMALYZE_MIN, GAMALYZE_MAX, out=sensitivity_to_reward)
 
     return {
         'sensitivity_to_loss': sensitivity_to_loss,
@@ -132,8 +138,8 @@ def generate_gamalyze_scores(players_df: pd.DataFrame) -> pd.DataFrame:
     """
     print(f"Generating Gamalyze scores for {len(players_df)} players...")
 
-    # Set random seed
-    np.random.seed(RANDOM_SEED + 1)  # Offset to avoid same RNG as players
+    # Set random seed (one Generator per call)
+    rng = np.random.default_rng(RANDOM_SEED + 1)  # Offset to avoid same RNG as players
 
     # Extract latent factors
     latent_sensitivity = players_df['latent_sensitivity'].values
@@ -144,33 +150,28 @@ def generate_gamalyze_scores(players_df: pd.DataFrame) -> pd.DataFrame:
     gamalyze_scores = transform_latent_to_gamalyze(
         latent_sensitivity,
         latent_risk_tolerance,
-        latent_consistency
+        latent_consistency,
+        rng=rng
     )
 
-    # Build DataFrame
-    gamalyze_records = []
-
-    for i, row in players_df.iterrows():
-        # Generate random assessment date (past 90 days from START_DATE)
-        assessment_date = random_date_past_n_days(
-            START_DATE,
-            GAMALYZE_ASSESSMENT_LOOKBACK_DAYS
-        )
-
-        record = {
-            'assessment_id': generate_assessment_id(row['player_id']),
-            'player_id': row['player_id'],
-            'assessment_date': format_date(assessment_date),
-            'sensitivity_to_loss': round(gamalyze_scores['sensitivity_to_loss'][i], 2),
-            'sensitivity_to_reward': round(gamalyze_scores['sensitivity_to_reward'][i], 2),
-            'risk_tolerance': round(gamalyze_scores['risk_tolerance'][i], 2),
-            'decision_consistency': round(gamalyze_scores['decision_consistency'][i], 2),
-            'gamalyze_version': GAMALYZE_VERSION
-        }
-
-        gamalyze_records.append(record)
-
-    gamalyze_df = pd.DataFrame(gamalyze_records)
+    # Build DataFrame column-wise from the player columns (no per-row Series)
+    player_ids = players_df['player_id'].tolist()
+
+    # Generate random assessment dates (past 90 days from START_DATE)
+    assessment_dates = format_dates(random_dates_past_n_days(
+        START_DATE, GAMALYZE_ASSESSMENT_LOOKBACK_DAYS, len(player_ids), rng
+    ))
+
+    gamalyze_df = pd.DataFrame({
+        'assessment_id': generate_assessment_ids(players_df['player_id']).to_numpy(),
+        'player_id': player_ids,
+        'assessment_date': assessment_dates,
+        'sensitivity_to_loss': np.round(gamalyze_scores['sensitivity_to_loss'], 2),
+        'sensitivity_to_reward': np.round(gamalyze_scores['sensitivity_to_reward'], 2),
+        'risk_tolerance': np.round(gamalyze_scores['risk_tolerance'], 2),
+        'decision_consistency': np.round(gamalyze_scores['decision_consistency'], 2),
+        'gamalyze_version': GAMALYZE_VERSION
+    })
 
     print(f"✓ Generated {len(gamalyze_df)} Gamalyze assessments")
 
@@ -179,16 +180,16 @@ def generate_gamalyze_scores(players_df: pd.DataFrame) -> pd.DataFrame:
 
 def export_gamalyze_csv(gamalyze_df: pd.DataFrame, output_path: str):
     """
-    Export Gamalyze scores to CSV.
+    Export Gamalyze scores to CSV or Parquet.
 
     Args:
         gamalyze_df: Gamalyze scores DataFrame
-        output_path: Path for output CSV
+        output_path: Path for output file (.csv or .parquet)
 
     Returns:
         None (writes file)
     """
-    gamalyze_df.to_csv(output_path, index=False)
+    write_table(gamalyze_df, output_path, parquet_types={'assessment_date': 'DATE'})
     print(f"✓ Exported Gamalyze scores to {output_path}")
 
 
@@ -218,10 +219,7 @@ def validate_gamalyze_scores(gamalyze_df: pd.DataFrame,
           f"{'✓' if results['count_match'] else '✗'}")
 
     # Value range validation
-    score_columns = ['sensitivity_to_loss', 'sensitivity_to_reward',
-                    'risk_tolerance', 'decision_consistency']
-
-    for col in score_columns:
+    for col in SCORE_COLUMNS:
         in_range = ((gamalyze_df[col] >= 0) & (gamalyze_df[col] <= 100)).all()
         results[f'{col}_range'] = in_range
         print(f"  {col} in [0, 100]: {'✓' if in_range else '✗'}")
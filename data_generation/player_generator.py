@@ -15,7 +15,7 @@ Latent factors ensure correlations across tables:
 import pandas as pd
 import numpy as np
 from faker import Faker
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .config import (
     TOTAL_PLAYERS,
     COHORT_DISTRIBUTION,
@@ -24,7 +24,7 @@ from .config import (
     RANDOM_SEED
 )
 from .correlations import generate_latent_factors_for_cohort
-from .utils import generate_player_id
+from .utils import generate_player_id, write_table
 
 
 def assign_cohorts(n_players: int) -> np.ndarray:
@@ -73,7 +73,8 @@ def assign_states(n_players: int) -> np.ndarray:
     return states
 
 
-def generate_latent_factors_all_cohorts(cohort_assignments: np.ndarray) -> np.ndarray:
+def generate_latent_factors_all_cohorts(cohort_assignments: np.ndarray,
+                                        rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Generate latent factors for all players across all cohorts.
 
@@ -83,6 +84,7 @@ def generate_latent_factors_all_cohorts(cohort_assignments: np.ndarray) -> np.nd
 
     Args:
         cohort_assignments: Array of cohort labels for each player
+        rng: numpy Generator for the multivariate normal draws
 
     Returns:
         Array of shape (n_players, 4) with latent factors:
@@ -100,7 +102,7 @@ def generate_latent_factors_all_cohorts(cohort_assignments: np.ndarray) -> np.nd
         n_in_cohort = cohort_mask.sum()
 
         if n_in_cohort > 0:
-            cohort_factors = generate_latent_factors_for_cohort(n_in_cohort, cohort)
+            cohort_factors = generate_latent_factors_for_cohort(n_in_cohort, cohort, rng)
             latent_factors[cohort_mask] = cohort_factors
 
     return latent_factors
@@ -184,7 +186,9 @@ def generate_players(n_players: int = TOTAL_PLAYERS) -> pd.DataFrame:
 
     # Step 3: Generate latent factors (the "genetic code")
     print(f"  Generating correlated latent factors...")
-    latent_factors = generate_latent_factors_all_cohorts(cohorts)
+    latent_factors = generate_latent_factors_all_cohorts(
+        cohorts, np.random.default_rng(RANDOM_SEED)
+    )
 
     # Step 4: Generate demographics
     print(f"  Generating demographics...")
@@ -258,13 +262,13 @@ def get_players_by_state(players_df: pd.DataFrame, state: str) -> pd.DataFrame:
 
 def export_players_csv(players_df: pd.DataFrame, output_path: str):
     """
-    Export players to CSV (without internal latent columns).
+    Export players to CSV or Parquet (without internal latent columns).
 
     Removes latent factor columns before export as these are internal only.
 
     Args:
         players_df: Full players DataFrame
-        output_path: Path for output CSV
+        output_path: Path for output file (.csv or .parquet)
 
     Returns:
         None (writes file)
@@ -281,7 +285,7 @@ def export_players_csv(players_df: pd.DataFrame, output_path: str):
     ]
 
     # Export only public columns
-    players_df[public_columns].to_csv(output_path, index=False)
+    write_table(players_df[public_columns], output_path)
     print(f"✓ Exported players to {output_path}")
 
 
@@ -11,7 +11,7 @@ Contains helper functions for:
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Union, List
+from typing import Dict, List, Optional, Union
 import random
 
 
@@ -133,6 +133,25 @@ def generate_assessment_id(player_id: str) -> str:
     return f"ASSESS_{player_id}"
 
 
+def generate_assessment_ids(player_ids: pd.Series) -> pd.Series:
+    """
+    Generate Gamalyze assessment IDs for a column of player IDs.
+
+    Array version of generate_assessment_id (one vectorized concatenation).
+
+    Args:
+        player_ids: Series of player IDs
+
+    Returns:
+        Series of assessment IDs
+
+    Examples:
+        >>> generate_assessment_ids(pd.Series(['PLR_0001_MA'])).tolist()
+        ['ASSESS_PLR_0001_MA']
+    """
+    return "ASSESS_" + player_ids.astype(str)
+
+
 def random_date_in_window(start_date: str,
                           end_date: str) -> datetime:
     """
@@ -181,6 +200,35 @@ def random_date_past_n_days(reference_date: str,
     return ref - timedelta(days=days_back)
 
 
+def random_dates_past_n_days(reference_date: str,
+                             n_days: int,
+                             size: int,
+                             rng=None) -> np.ndarray:
+    """
+    Generate `size` random dates in past N days from reference in one draw.
+
+    Array version of random_date_past_n_days.
+
+    Args:
+        reference_date: Reference date (YYYY-MM-DD format)
+        n_days: Number of days to look back
+        size: Number of dates to generate
+        rng: numpy Generator (or np.random) to draw from (default np.random)
+
+    Returns:
+        datetime64[s] array of random datetimes in past N days
+
+    Examples:
+        >>> dates = random_dates_past_n_days('2026-01-01', 90, 3)
+        >>> dates.dtype
+        dtype('<M8[s]')
+    """
+    rng = np.random if rng is None else rng
+    days_back = rng.uniform(0, n_days, size=size)
+    seconds_back = (days_back * 86400).astype('timedelta64[s]')
+    return np.datetime64(reference_date, 's') - seconds_back
+
+
 def generate_realistic_odds(sport: str) -> int:
     """
     Generate realistic American odds for a given sport.
@@ -277,6 +325,21 @@ def format_date(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d')
 
 
+def format_dates(dates: np.ndarray) -> List[str]:
+    """
+    Format a datetime64 array as date-only strings in one call.
+
+    Array version of format_date.
+
+    Args:
+        dates: datetime64 array
+
+    Returns:
+        List of date strings (YYYY-MM-DD)
+    """
+    return np.datetime_as_string(np.asarray(dates, dtype='datetime64[s]'), unit='D').tolist()
+
+
 def sample_from_range(range_tuple: tuple,
                      distribution: str = 'uniform') -> float:
     """
@@ -432,6 +495,66 @@ def calculate_days_between(date1: str, date2: str) -> int:
     return abs((d2 - d1).days)
 
 
+# =============================================================================
+# EXPORT UTILITIES
+# =============================================================================
+
+def write_table(df: pd.DataFrame,
+                output_path: str,
+                parquet_types: Optional[Dict[str, str]] = None):
+    """
+    Write a DataFrame to CSV or Parquet, chosen by file extension.
+
+    Both formats are written through DuckDB (already a project dependency),
+    so pyarrow is not required. DuckDB's C++ CSV writer produces the same
+    bytes as pandas to_csv for string/numeric frames several times faster;
+    frames with other column types (e.g. bool, datetime) fall back to pandas.
+    Parquet is columnar and typed, which makes it much faster to write and
+    load than CSV for the 500K-row bets table.
+
+    Args:
+        df: DataFrame to write
+        output_path: Destination path ending in .csv or .parquet
+        parquet_types: Column -> DuckDB type casts for string columns that
+            CSV readers would infer (e.g. {'bet_timestamp': 'TIMESTAMP'})
+
+    Returns:
+        None (writes file)
+    """
+    is_parquet = str(output_path).endswith('.parquet')
+    if not is_parquet and not all(_csv_compatible(df[column]) for column in df.columns):
+        df.to_csv(output_path, index=False)
+        return
+
+    import duckdb
+
+    select = "SELECT * FROM export_df"
+    if is_parquet and parquet_types:
+        casts = ", ".join(
+            f"CAST({column} AS {sql_type}) AS {column}"
+            for column, sql_type in parquet_types.items()
+        )
+        select = f"SELECT * REPLACE ({casts}) FROM export_df"
+
+    conn = duckdb.connect()
+    try:
+        conn.register('export_df', df)
+        target = str(output_path).replace("'", "''")
+        options = "FORMAT PARQUET, COMPRESSION SNAPPY" if is_parquet else "FORMAT CSV, HEADER"
+        conn.execute(f"COPY ({select}) TO '{target}' ({options})")
+    finally:
+        conn.close()
+
+
+def _csv_compatible(column: pd.Series) -> bool:
+    """Whether DuckDB writes this column to CSV exactly as pandas would."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.cat.categories.to_series()
+    if column.dtype.kind == 'O':
+        return pd.api.types.infer_dtype(column, skipna=True) in ('string', 'empty')
+    return column.dtype.kind in 'iuf'
+
+
 # =============================================================================
 # TESTING UTILITIES
 # =============================================================================
@@ -1,7 +1,7 @@
 """
 DK Sentinel - DuckDB Data Loader
 
-Loads generated CSV files into DuckDB for local development.
+Loads generated CSV (or Parquet) files into DuckDB for local development.
 This provides a fast, embedded analytics database for testing dbt models
 before migrating to Snowflake.
 
@@ -22,17 +22,22 @@ import sys
 
 
 def check_csv_files():
-    """Check if required CSV files exist."""
-    required_files = [
-        'data/players.csv',
-        'data/bets.csv',
-        'data/gamalyze_scores.csv'
-    ]
-
+    """Check required data files exist, using the newer of Parquet and CSV."""
+    required_files = []
     missing = []
-    for filepath in required_files:
-        if not Path(filepath).exists():
-            missing.append(filepath)
+    for name in ('players', 'bets', 'gamalyze_scores'):
+        candidates = [
+            path for path in (Path(f'data/{name}.parquet'), Path(f'data/{name}.csv'))
+            if path.exists()
+        ]
+        if not candidates:
+            missing.append(f'data/{name}.csv')
+            continue
+        # Both exist after switching --format: load the latest generation run
+        newest = max(candidates, key=lambda path: path.stat().st_mtime)
+        if len(candidates) > 1:
+            print(f"  {name}: found .parquet and .csv, loading newer {newest}")
+        required_files.append(str(newest))
 
     if missing:
         print("❌ Error: Required CSV files not found:")
@@ -57,25 +62,30 @@ def create_schemas(conn):
 
 
 def load_csv_files(conn, csv_files):
-    """Load CSV files into DuckDB tables using read_csv_auto."""
-    print("\n[3/4] Loading CSV files...")
+    """Load CSV/Parquet files into DuckDB tables (read_csv_auto / read_parquet)."""
+    print("\n[3/4] Loading data files...")
 
-    # Mapping of CSV files to table names
+    # Mapping of file stems to table names
     table_mapping = {
-        'data/players.csv': 'raw.player_accounts',
-        'data/bets.csv': 'raw.bet_transactions',
-        'data/gamalyze_scores.csv': 'raw.gamalyze_assessments'
+        'players': 'raw.player_accounts',
+        'bets': 'raw.bet_transactions',
+        'gamalyze_scores': 'raw.gamalyze_assessments'
     }
 
     row_counts = {}
 
-    for csv_file, table_name in table_mapping.items():
-        print(f"  Loading {csv_file} → {table_name}")
+    for data_file in csv_files:
+        table_name = table_mapping[Path(data_file).stem]
+        print(f"  Loading {data_file} → {table_name}")
 
-        # Use DuckDB's read_csv_auto for automatic type inference
+        if data_file.endswith('.parquet'):
+            source = f"read_parquet('{data_file}')"
+        else:
+            # Use DuckDB's read_csv_auto for automatic type inference
+            source = f"read_csv_auto('{data_file}', header=true)"
         conn.execute(f"""
             CREATE OR REPLACE TABLE {table_name} AS
-            SELECT * FROM read_csv_auto('{csv_file}', header=true)
+            SELECT * FROM {source}
         """)
 
         # Get row count
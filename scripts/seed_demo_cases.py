@@ -794,41 +794,59 @@ def _state_query_pack(case: CaseCandidate, metrics: BehaviorMetrics) -> list[tup
 
 
 def _seed_case_status(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_id: str) -> None:
+    status_rows = []
+    queue_rows = []
     for plan in plans:
-        conn.execute(
-            """
-            INSERT INTO rg_case_status_log (case_id, player_id, analyst_id, status, started_at, submitted_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        case_id = f"CASE-{plan.case.player_id}"
+        status_rows.append(
             (
-                f"CASE-{plan.case.player_id}",
+                case_id,
                 plan.case.player_id,
                 analyst_id,
                 plan.status,
                 plan.started_at,
                 plan.submitted_at,
                 plan.updated_at,
-            ),
+            )
         )
-
-        conn.execute(
-            """
-            INSERT INTO rg_queue_cases (case_id, player_id, risk_category, composite_risk_score, assigned_at, batch_id, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+        queue_rows.append(
             (
-                f"CASE-{plan.case.player_id}",
+                case_id,
                 plan.case.player_id,
                 plan.case.risk_category,
                 plan.case.composite_risk_score,
                 plan.assigned_at,
                 "DEMO_BATCH",
                 plan.status,
-            ),
+            )
         )
 
+    conn.executemany(
+        """
+        INSERT INTO rg_case_status_log (case_id, player_id, analyst_id, status, started_at, submitted_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        status_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_queue_cases (case_id, player_id, risk_category, composite_risk_score, assigned_at, batch_id, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        queue_rows,
+    )
+
 
 def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_id: str, seed: int) -> None:
+    # Rows are collected per table and written with one executemany each,
+    # rather than planning a separate INSERT for every row.
+    note_rows = []
+    prompt_rows = []
+    query_rows = []
+    trigger_rows = []
+    nudge_rows = []
+    draft_rows = []
+
     for plan in plans:
         case = plan.case
         metrics = _fetch_behavior_metrics(conn, case.player_id)
@@ -849,11 +867,7 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
             f"Follow-up: {findings['follow_up_plan']}"
         )
 
-        conn.execute(
-            """
-            INSERT INTO rg_analyst_notes_log (log_id, player_id, analyst_id, analyst_action, analyst_notes, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        note_rows.append(
             (
                 str(uuid4()),
                 case.player_id,
@@ -861,18 +875,14 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                 findings["action"],
                 note,
                 plan.note_at,
-            ),
+            )
         )
 
         ai_response = (
             f"{findings['finding_summary']} {findings['gamalyze_context']} "
             f"Decision rationale: {findings['decision_rationale']}"
         )
-        conn.execute(
-            """
-            INSERT INTO rg_llm_prompt_log (log_id, player_id, analyst_id, prompt_text, response_text, created_at, route_type, tool_used)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        prompt_rows.append(
             (
                 str(uuid4()),
                 case.player_id,
@@ -882,19 +892,12 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                 plan.ai_prompt_at,
                 "GENERAL_RG",
                 "semantic_auditor",
-            ),
+            )
         )
 
         for idx, (purpose, sql_text, summary, columns, rows, triggered, reason) in enumerate(query_pack):
             created_at = plan.query_times[min(idx, len(plan.query_times) - 1)]
-            conn.execute(
-                """
-                INSERT INTO rg_query_log (
-                    log_id, player_id, analyst_id, prompt_text, draft_sql, final_sql, purpose, result_summary,
-                    result_columns, result_rows, row_count, duration_ms, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            query_rows.append(
                 (
                     str(uuid4()),
                     case.player_id,
@@ -909,15 +912,11 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                     len(rows),
                     30 + idx * 9,
                     created_at,
-                ),
+                )
             )
 
             if purpose.startswith("Regulatory Trigger Check"):
-                conn.execute(
-                    """
-                    INSERT INTO rg_trigger_check_log (player_id, state, triggered, reason, sql_text, row_count, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                trigger_rows.append(
                     (
                         case.player_id,
                         case.state_jurisdiction,
@@ -926,7 +925,7 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                         sql_text,
                         len(rows),
                         plan.trigger_at,
-                    ),
+                    )
                 )
 
         supplemental_sql = (
@@ -938,14 +937,7 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
             f"Signal ranking validated for {case.player_id}. Top drivers: "
             f"{', '.join(label for label, _ in _top_signals(case))}."
         )
-        conn.execute(
-            """
-            INSERT INTO rg_query_log (
-                log_id, player_id, analyst_id, prompt_text, draft_sql, final_sql, purpose, result_summary,
-                result_columns, result_rows, row_count, duration_ms, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        query_rows.append(
             (
                 str(uuid4()),
                 case.player_id,
@@ -980,18 +972,13 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                 1,
                 44,
                 plan.query_times[-1] + timedelta(minutes=5),
-            ),
+            )
         )
 
         if plan.status == "SUBMITTED" and plan.nudge_at is not None:
             nudge_text = findings["nudge_copy"]
             final_nudge = nudge_text + " We are here to support you in staying in control of your play."
-            conn.execute(
-                """
-                INSERT INTO rg_nudge_log (
-                    log_id, player_id, analyst_id, draft_nudge, final_nudge, validation_status, validation_violations, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            nudge_rows.append(
                 (
                     str(uuid4()),
                     case.player_id,
@@ -1001,23 +988,66 @@ def _seed_logs(conn: duckdb.DuckDBPyConnection, plans: list[CasePlan], analyst_i
                     "PASS",
                     json.dumps([]),
                     plan.nudge_at,
-                ),
+                )
             )
         else:
-            conn.execute(
-                """
-                INSERT INTO rg_analyst_notes_draft (player_id, analyst_id, draft_notes, draft_action, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+            draft_rows.append(
                 (
                     case.player_id,
                     analyst_id,
                     f"Draft in progress for {case.player_id}. {findings['follow_up_plan']}",
                     "REVIEWING",
                     plan.note_at,
-                ),
+                )
             )
 
+    conn.executemany(
+        """
+        INSERT INTO rg_analyst_notes_log (log_id, player_id, analyst_id, analyst_action, analyst_notes, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        note_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_llm_prompt_log (log_id, player_id, analyst_id, prompt_text, response_text, created_at, route_type, tool_used)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        prompt_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_query_log (
+            log_id, player_id, analyst_id, prompt_text, draft_sql, final_sql, purpose, result_summary,
+            result_columns, result_rows, row_count, duration_ms, created_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        query_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_trigger_check_log (player_id, state, triggered, reason, sql_text, row_count, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        trigger_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_nudge_log (
+            log_id, player_id, analyst_id, draft_nudge, final_nudge, validation_status, validation_violations, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        nudge_rows,
+    )
+    conn.executemany(
+        """
+        INSERT INTO rg_analyst_notes_draft (player_id, analyst_id, draft_notes, draft_action, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        draft_rows,
+    )
+
 
 def _write_manifest(completed_cases: list[CaseCandidate], in_progress_cases: list[CaseCandidate], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1063,7 +1093,6 @@ def seed_demo_cases(
     conn = _connect(db_path)
     try:
         _ensure_runtime_tables(conn)
-        _clear_runtime_tables(conn)
 
         candidates = _load_candidates(conn)
         preferred_ids = _load_preferred_player_ids(preferred_player_ids_path)
@@ -1080,8 +1109,26 @@ def seed_demo_cases(
             for idx, case in enumerate(in_progress_cases)
         ]
 
-        _seed_case_status(conn, [*completed_plans, *in_progress_plans], analyst_id)
-        _seed_logs(conn, [*completed_plans, *in_progress_plans], analyst_id, seed)
+        # Clear and reseed as two transactions: a couple of commits instead of
+        # one per statement. The clear must commit first because DuckDB rejects
+        # re-inserting a unique key (idx_rg_analyst_notes_draft_player) that
+        # was deleted earlier in the same transaction.
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            _clear_runtime_tables(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            _seed_case_status(conn, [*completed_plans, *in_progress_plans], analyst_id)
+            _seed_logs(conn, [*completed_plans, *in_progress_plans], analyst_id, seed)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
         _write_manifest(completed_cases, in_progress_cases, Path(manifest_path))
 
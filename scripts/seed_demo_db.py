@@ -20,6 +20,8 @@ import random
 from datetime import datetime, timedelta, date
 
 import duckdb
+import numpy as np
+import pandas as pd
 
 
 STATES = ["NJ", "MA", "PA"]
@@ -127,6 +129,19 @@ def _payout(bet_amount: float, odds_american: int, outcome: str) -> float:
     return round(bet_amount * (100.0 / abs(odds_american)), 2)
 
 
+def _bulk_insert(
+    conn: duckdb.DuckDBPyConnection, table: str, rows: list[tuple] | pd.DataFrame
+) -> None:
+    # Scanning a DataFrame loads the batch vectorized instead of binding each
+    # row through executemany.
+    frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(rows)
+    conn.register("seed_rows", frame)
+    try:
+        conn.execute(f"INSERT INTO {table} SELECT * FROM seed_rows")
+    finally:
+        conn.unregister("seed_rows")
+
+
 def seed_demo_db(db_path: str, player_count: int) -> None:
     random.seed(42)
 
@@ -236,12 +251,13 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
             bet_amount = _bet_amount(category)
             odds = _odds()
             outcome = random.choice(OUTCOMES)
-            bet_ts = now - timedelta(days=random.randint(0, 89), hours=random.randint(0, 23))
+            # Hours before `now`; converted to timestamps in one array op below.
+            bet_age_hours = random.randint(0, 89) * 24 + random.randint(0, 23)
             bets.append(
                 (
                     f"BET_{bet_id_counter:08d}",
                     player_id,
-                    bet_ts,
+                    bet_age_hours,
                     random.choice(SPORTS),
                     random.choice(MARKETS),
                     bet_amount,
@@ -289,10 +305,7 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
         )
         """
     )
-    conn.executemany(
-        "INSERT INTO staging_staging.stg_player_profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        players,
-    )
+    _bulk_insert(conn, "staging_staging.stg_player_profiles", players)
 
     drop_object("staging_staging.stg_bet_logs")
     conn.execute(
@@ -314,10 +327,9 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
         )
         """
     )
-    conn.executemany(
-        "INSERT INTO staging_staging.stg_bet_logs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        bets,
-    )
+    bet_frame = pd.DataFrame.from_records(bets)
+    bet_frame[2] = np.datetime64(now) - bet_frame[2].to_numpy().astype("timedelta64[h]")
+    _bulk_insert(conn, "staging_staging.stg_bet_logs", bet_frame)
 
     drop_object("staging_staging.stg_gamalyze_scores")
     conn.execute(
@@ -336,10 +348,7 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
         )
         """
     )
-    conn.executemany(
-        "INSERT INTO staging_staging.stg_gamalyze_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        gamalyze_scores,
-    )
+    _bulk_insert(conn, "staging_staging.stg_gamalyze_scores", gamalyze_scores)
 
     drop_object("staging_prod.rg_risk_scores")
     conn.execute(
@@ -357,10 +366,7 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
         )
         """
     )
-    conn.executemany(
-        "INSERT INTO staging_prod.rg_risk_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        risk_scores,
-    )
+    _bulk_insert(conn, "staging_prod.rg_risk_scores", risk_scores)
 
     drop_object("staging_prod.rg_intervention_queue")
     conn.execute(
@@ -379,10 +385,7 @@ def seed_demo_db(db_path: str, player_count: int) -> None:
         )
         """
     )
-    conn.executemany(
-        "INSERT INTO staging_prod.rg_intervention_queue VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        intervention_queue,
-    )
+    _bulk_insert(conn, "staging_prod.rg_intervention_queue", intervention_queue)
 
     # Clear runtime queue so stale player IDs from prior seeds do not persist.
     try: